@@ -7,19 +7,42 @@ Larkチャットで@メンションされたメッセージを処理し、
 
 import asyncio
 import hashlib
+import hmac
 import json
 import logging
 import os
 import re
 import time
 from typing import Any, Dict, Optional
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from fastapi import FastAPI, Request, HTTPException, Header
+from fastapi import FastAPI, Request, HTTPException, Header, BackgroundTasks
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
+try:
+    # orjson（Rust実装）があればJSONパースに使用（2〜5倍高速）
+    import orjson
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+
+    def _loads(data: Any) -> Any:
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover
+    _loads = json.loads
+    _DefaultResponse = JSONResponse
+
+try:
+    # uvloopはWindowsには入らない（pyprojectのプラットフォーム条件参照）
+    # ので、存在する場合のみイベントループに指定する
+    import uvloop  # noqa: F401
+    _LOOP = "uvloop"
+except ImportError:  # pragma: no cover
+    _LOOP = "auto"
+
 from .lark_client import LarkClient
 from .smart_builder import SmartBitableBuilder, DocumentationGenerator
 from .message_handler import MessageHandler, MessageParser
@@ -28,6 +51,53 @@ from .message_handler import MessageHandler, MessageParser
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# @メンション除去用の正規表現（メッセージごとの再コンパイルを回避）
+_USER_MENTION_RE = re.compile(r'@_user_\d+')
+_MENTION_RE = re.compile(r'@\S+')
+
+# これ以上のペイロードはJSONパースをスレッドに逃がす（イベントループ保護）
+_PARSE_OFFLOAD_THRESHOLD = 64 * 1024
+
+# Webhookペイロードの上限（Larkイベントはこれより遥かに小さい）
+_MAX_WEBHOOK_BYTES = 1024 * 1024
+
+# Bot追加時のウェルカムメッセージ（イベントごとの文字列構築を回避）
+WELCOME_MESSAGE = """
+🤖 **LarkMasterMCP Bot** がチャットに参加しました！
+
+私に@メンションして話しかけると、以下のことができます：
+
+📊 **Bitable作成**
+「顧客管理テーブルを作成して」
+「プロジェクト管理用のベースを作って」
+
+📚 **Wiki/ドキュメント**
+「Wikiスペースを作成」
+「ドキュメントを作成」
+
+✅ **タスク**
+「タスクを追加: レビュー依頼」
+
+💡 **ヘルプ**
+「ヘルプ」と入力すると詳しい使い方が見れます！
+
+さっそく試してみてください！
+"""
+
+
+class PathExemptCORSMiddleware(CORSMiddleware):
+    """/webhook配下をスキップするCORSミドルウェア
+
+    WebhookはLarkサーバーからの直接POSTでブラウザを介さないため
+    CORS処理が不要。ホットパスからヘッダー検査・付与を除外します。
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/webhook"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 
 class LarkBotServer:
     """
@@ -48,6 +118,8 @@ class LarkBotServer:
         self.app_secret = app_secret
         self.verification_token = verification_token
         self.encrypt_key = encrypt_key
+        # 署名検証用にキーのバイト列を事前計算（リクエストごとのencodeを回避）
+        self._encrypt_key_bytes = encrypt_key.encode("utf-8") if encrypt_key else None
 
         # Lark Client
         self.lark_client = LarkClient(app_id, app_secret)
@@ -58,41 +130,125 @@ class LarkBotServer:
         self.message_handler = MessageHandler(self.lark_client, self.smart_builder)
 
         # 処理済みメッセージIDを追跡（重複防止）
-        self.processed_messages: Dict[str, float] = {}
+        # OrderedDictをLRUとして使用（挿入順 = 古い順）
+        self.processed_messages: "OrderedDict[str, float]" = OrderedDict()
+        self._max_processed = 10_000
+
+        # 複数ワーカー起動時はRedisで重複チェックを共有（REDIS_URLで有効化）
+        self._redis = None
+        redis_url = os.environ.get("REDIS_URL", "")
+        if redis_url:
+            try:
+                import redis.asyncio as aioredis
+                self._redis = aioredis.from_url(redis_url)
+                logger.info("Using Redis for message deduplication")
+            except ImportError:
+                logger.warning(
+                    "REDIS_URL is set but the redis package is not installed; "
+                    "falling back to in-process deduplication"
+                )
+
+        # イベントタイプ → ハンドラのディスパッチテーブル
+        self._event_handlers = {
+            "im.message.receive_v1": self.handle_message_event,
+            "im.chat.member.bot.added_v1": self.handle_bot_added,
+        }
 
         logger.info("LarkBotServer initialized")
 
-    def _clean_old_messages(self):
-        """古い処理済みメッセージIDを削除（メモリ節約）"""
-        current_time = time.time()
-        # 5分以上前のメッセージIDを削除
-        self.processed_messages = {
-            msg_id: timestamp
-            for msg_id, timestamp in self.processed_messages.items()
-            if current_time - timestamp < 300
-        }
+    def verify_signature(
+        self,
+        timestamp: str,
+        nonce: str,
+        signature: str,
+        body: bytes
+    ) -> bool:
+        """Larkリクエスト署名を検証
+
+        Larkの署名仕様: sha256(timestamp + nonce + encrypt_key + body)
+        タイミング攻撃を避けるため hmac.compare_digest で比較します。
+        encrypt_key未設定時は検証をスキップ（常にTrue）。
+        """
+        if not self._encrypt_key_bytes:
+            return True
+
+        digest = hashlib.sha256(
+            timestamp.encode("utf-8")
+            + nonce.encode("utf-8")
+            + self._encrypt_key_bytes
+            + body
+        ).hexdigest()
+        return hmac.compare_digest(digest, signature)
+
+    async def _is_duplicate(self, message_id: str) -> bool:
+        """重複メッセージかどうかを確認
+
+        Redisが設定されていれば SET NX EX 300 で全ワーカー共有の
+        アトミックな冪等キーを使用。未設定またはRedis障害時は
+        プロセス内LRUにフォールバックします。
+        """
+        if self._redis is not None:
+            try:
+                was_set = await self._redis.set(
+                    f"lark:msg:{message_id}", 1, nx=True, ex=300
+                )
+                return not was_set
+            except Exception as e:
+                logger.warning("Redis dedup failed, falling back to local: %s", e)
 
-    def _is_duplicate(self, message_id: str) -> bool:
-        """重複メッセージかどうかを確認"""
-        self._clean_old_messages()
+        return self._is_duplicate_local(message_id)
+
+    def _is_duplicate_local(self, message_id: str) -> bool:
+        """重複メッセージかどうかを確認
+
+        サイズ上限付きLRU + 遅延TTL削除。挿入・参照ともO(1)で、
+        先頭（最古）エントリの期限切れ分だけをその場で削除します。
+        """
+        now = time.time()
 
         if message_id in self.processed_messages:
+            self.processed_messages.move_to_end(message_id)
             return True
 
-        self.processed_messages[message_id] = time.time()
+        self.processed_messages[message_id] = now
+
+        # 最古エントリから、期限切れ（5分）または容量超過分のみ削除
+        while self.processed_messages and (
+            now - next(iter(self.processed_messages.values())) > 300
+            or len(self.processed_messages) > self._max_processed
+        ):
+            self.processed_messages.popitem(last=False)
+
         return False
 
-    def _extract_text_from_content(self, content: str) -> str:
-        """メッセージコンテンツからテキストを抽出"""
-        try:
-            content_json = json.loads(content)
-            text = content_json.get("text", "")
-        except (json.JSONDecodeError, TypeError):
-            text = content if isinstance(content, str) else ""
+    async def _extract_text_from_content(self, content: str) -> str:
+        """メッセージコンテンツからテキストを抽出
+
+        巨大なペイロードのJSONパースはスレッドにオフロードして
+        イベントループのブロックを防ぎます。
+        """
+        if isinstance(content, str) and len(content) >= _PARSE_OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(self._extract_text_sync, content)
+        return self._extract_text_sync(content)
+
+    def _extract_text_sync(self, content: str) -> str:
+        """メッセージコンテンツからテキストを抽出（同期版）"""
+        if not isinstance(content, str):
+            return ""
+
+        # JSONオブジェクトでないものはデコードを試みず素通し（fast path）
+        if content.lstrip()[:1] == "{":
+            try:
+                content_json = _loads(content)
+                text = content_json.get("text", "")
+            except (ValueError, TypeError):
+                text = content
+        else:
+            text = content
 
         # @メンションを除去
-        text = re.sub(r'@_user_\d+', '', text)
-        text = re.sub(r'@\S+', '', text)
+        text = _USER_MENTION_RE.sub('', text)
+        text = _MENTION_RE.sub('', text)
         text = text.strip()
 
         return text
@@ -100,32 +256,25 @@ class LarkBotServer:
     async def handle_url_verification(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """URL検証チャレンジを処理"""
         challenge = data.get("challenge", "")
-        logger.info(f"URL verification challenge received")
+        logger.info("URL verification challenge received")
         return {"challenge": challenge}
 
     async def handle_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
-        """イベントを処理"""
-        # イベントタイプを取得
-        schema = event_data.get("schema", "")
-        header = event_data.get("header", {})
-        event_type = header.get("event_type", "")
+        """イベントを処理（ディスパッチテーブル経由）"""
+        event_type = event_data.get("header", {}).get("event_type", "")
 
-        logger.info(f"Received event: {event_type}")
+        logger.info("Received event: %s", event_type)
 
         # URL検証
         if event_data.get("type") == "url_verification":
             return await self.handle_url_verification(event_data)
 
-        # メッセージ受信イベント
-        if event_type == "im.message.receive_v1":
-            return await self.handle_message_event(event_data)
-
-        # Bot追加イベント
-        if event_type == "im.chat.member.bot.added_v1":
-            return await self.handle_bot_added(event_data)
+        handler = self._event_handlers.get(event_type)
+        if handler:
+            return await handler(event_data)
 
         # その他のイベント
-        logger.info(f"Unhandled event type: {event_type}")
+        logger.info("Unhandled event type: %s", event_type)
         return {"status": "ignored", "event_type": event_type}
 
     async def handle_message_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -138,8 +287,8 @@ class LarkBotServer:
         message_id = message.get("message_id", "")
 
         # 重複チェック
-        if self._is_duplicate(message_id):
-            logger.info(f"Duplicate message ignored: {message_id}")
+        if await self._is_duplicate(message_id):
+            logger.info("Duplicate message ignored: %s", message_id)
             return {"status": "duplicate"}
 
         # チャットID
@@ -158,30 +307,39 @@ class LarkBotServer:
 
         # テキストメッセージのみ処理
         if message_type != "text":
-            logger.info(f"Non-text message ignored: {message_type}")
+            logger.info("Non-text message ignored: %s", message_type)
             return {"status": "ignored_non_text"}
 
         # メッセージ内容を取得
         content = message.get("content", "{}")
-        text = self._extract_text_from_content(content)
+        text = await self._extract_text_from_content(content)
 
         if not text:
             return {"status": "empty_message"}
 
-        logger.info(f"Processing message from {sender_id}: {text[:50]}...")
+        logger.info("Processing message from %s: %.50s...", sender_id, text)
 
         try:
             # メッセージを処理
             result = await self.message_handler.handle_message(text)
 
-            # 返信を送信
-            await self.lark_client.send_message(
-                chat_id=chat_id,
-                message=result.message,
-                message_type="text"
+            # 返信送信と既読ACKは独立したAPI呼び出しなので並行実行
+            reply_result, read_result = await asyncio.gather(
+                self.lark_client.send_message(
+                    chat_id=chat_id,
+                    message=result.message,
+                    message_type="text"
+                ),
+                self.lark_client.read_message([message_id]),
+                return_exceptions=True,
             )
+            if isinstance(reply_result, Exception):
+                raise reply_result
+            if isinstance(read_result, Exception):
+                # 既読ACKはベストエフォート
+                logger.debug("read_message failed: %s", read_result)
 
-            logger.info(f"Reply sent to {chat_id}")
+            logger.info("Reply sent to %s", chat_id)
 
             return {
                 "status": "processed",
@@ -190,7 +348,7 @@ class LarkBotServer:
             }
 
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
+            logger.error("Error processing message: %s", e)
 
             # エラー返信
             try:
@@ -200,7 +358,7 @@ class LarkBotServer:
                     message_type="text"
                 )
             except Exception as reply_error:
-                logger.error(f"Error sending error reply: {reply_error}")
+                logger.error("Error sending error reply: %s", reply_error)
 
             return {"status": "error", "error": str(e)}
 
@@ -209,45 +367,28 @@ class LarkBotServer:
         event = event_data.get("event", {})
         chat_id = event.get("chat_id", "")
 
-        logger.info(f"Bot added to chat: {chat_id}")
+        logger.info("Bot added to chat: %s", chat_id)
 
         # ウェルカムメッセージを送信
-        welcome_message = """
-🤖 **LarkMasterMCP Bot** がチャットに参加しました！
-
-私に@メンションして話しかけると、以下のことができます：
-
-📊 **Bitable作成**
-「顧客管理テーブルを作成して」
-「プロジェクト管理用のベースを作って」
-
-📚 **Wiki/ドキュメント**
-「Wikiスペースを作成」
-「ドキュメントを作成」
-
-✅ **タスク**
-「タスクを追加: レビュー依頼」
-
-💡 **ヘルプ**
-「ヘルプ」と入力すると詳しい使い方が見れます！
-
-さっそく試してみてください！
-"""
-
         try:
             await self.lark_client.send_message(
                 chat_id=chat_id,
-                message=welcome_message,
+                message=WELCOME_MESSAGE,
                 message_type="text"
             )
         except Exception as e:
-            logger.error(f"Error sending welcome message: {e}")
+            logger.error("Error sending welcome message: %s", e)
 
         return {"status": "welcomed", "chat_id": chat_id}
 
 
+@lru_cache(maxsize=1)
 def create_bot_app() -> FastAPI:
-    """FastAPI Bot アプリケーションを作成"""
+    """FastAPI Bot アプリケーションを作成
+
+    プロセス内シングルトン。複数回呼ばれても環境変数の再パースや
+    LarkBotServer（およびLarkClient接続プール）の再構築は行いません。
+    """
 
     app_id = os.environ.get("LARK_APP_ID", "")
     app_secret = os.environ.get("LARK_APP_SECRET", "")
@@ -267,6 +408,9 @@ def create_bot_app() -> FastAPI:
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         logger.info("🤖 LarkMasterMCP Bot Server starting...")
+        if bot_server:
+            # 最初のWebhookがTLSハンドシェイクを払わないよう接続を事前確立
+            await bot_server.lark_client.warmup()
         yield
         logger.info("👋 LarkMasterMCP Bot Server shutting down...")
 
@@ -274,14 +418,14 @@ def create_bot_app() -> FastAPI:
         title="LarkMasterMCP Bot Server",
         description="Larkチャットで@メンションで操作できるBot",
         version="0.2.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=_DefaultResponse,
     )
 
-    # CORS設定
+    # CORS設定（Webhookパスは対象外）
     app.add_middleware(
-        CORSMiddleware,
+        PathExemptCORSMiddleware,
         allow_origins=["*"],
-        allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
@@ -301,50 +445,106 @@ def create_bot_app() -> FastAPI:
         """Health check"""
         return {"status": "healthy"}
 
+    async def _process_event(body: Dict[str, Any]):
+        """レスポンス返却後にイベントを処理（バックグラウンド実行）"""
+        try:
+            await bot_server.handle_event(body)
+        except Exception as e:
+            logger.error("Background event processing error: %s", e)
+
     @app.post("/webhook/event")
-    async def webhook_event(request: Request):
+    async def webhook_event(request: Request, background_tasks: BackgroundTasks):
         """
         Lark Webhook イベント受信エンドポイント
 
         Lark Open Platformで以下のURLを設定:
         https://your-server.com/webhook/event
+
+        Larkは応答が遅いと再送してくるため、イベント処理は
+        BackgroundTasksに積んで即座にACKを返します。
         """
         if not bot_server:
             raise HTTPException(status_code=503, detail="Bot server not configured")
 
-        try:
-            body = await request.json()
-            logger.debug(f"Webhook received: {json.dumps(body, ensure_ascii=False)[:200]}")
+        # 巨大ペイロードは読み込み・パース前に拒否
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > _MAX_WEBHOOK_BYTES:
+            raise HTTPException(status_code=413, detail="Payload too large")
 
-            # URL検証（初回設定時）
-            if body.get("type") == "url_verification":
-                challenge = body.get("challenge", "")
-                return JSONResponse(content={"challenge": challenge})
+        raw_body = await request.body()
+        if len(raw_body) > _MAX_WEBHOOK_BYTES:
+            raise HTTPException(status_code=413, detail="Payload too large")
 
-            # イベント処理
-            result = await bot_server.handle_event(body)
-            return JSONResponse(content=result)
+        # 署名検証（encrypt_key設定時のみ）
+        if not bot_server.verify_signature(
+            request.headers.get("X-Lark-Request-Timestamp", ""),
+            request.headers.get("X-Lark-Request-Nonce", ""),
+            request.headers.get("X-Lark-Signature", ""),
+            raw_body,
+        ):
+            raise HTTPException(status_code=401, detail="Invalid signature")
 
-        except json.JSONDecodeError:
+        try:
+            body = _loads(raw_body)
+            # 遅延%フォーマット: DEBUG無効時は再シリアライズどころか
+            # 文字列構築自体が走らない
+            logger.debug("Webhook received: %.200s", raw_body)
+        except ValueError:
             raise HTTPException(status_code=400, detail="Invalid JSON")
-        except Exception as e:
-            logger.error(f"Webhook error: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
+
+        # URL検証（初回設定時）は同期的に応答する必要がある
+        if body.get("type") == "url_verification":
+            return {"challenge": body.get("challenge", "")}
+
+        # 先にACKを返し、イベント処理はレスポンス送信後に実行
+        background_tasks.add_task(_process_event, body)
+        return {"status": "accepted"}
 
     @app.post("/webhook/card")
     async def webhook_card(request: Request):
-        """カードアクションのWebhook（将来の拡張用）"""
-        body = await request.json()
-        logger.info(f"Card action received: {body}")
+        """カードアクションのWebhook（将来の拡張用）
+
+        現状はログのみのスタブのため、JSONパースせず生バイトを
+        遅延フォーマットでログに残すだけに留めます。
+        """
+        raw_body = await request.body()
+        logger.info("Card action received: %.500s", raw_body)
         return {"status": "ok"}
 
     return app
 
 
-def run_bot_server(host: str = "0.0.0.0", port: int = 8001):
-    """Bot サーバーを起動"""
-    app = create_bot_app()
-    uvicorn.run(app, host=host, port=port)
+def run_bot_server(host: str = "0.0.0.0", port: int = 8001, workers: int = 1):
+    """Bot サーバーを起動
+
+    uvloopが入っていればuvloop + httptoolsのCスタックで実行します。
+    マルチプロセスで起動する場合はファクトリ経由でも起動可能:
+    uvicorn lark_master_mcp.bot_server:create_bot_app --factory --workers N --loop uvloop --http httptools
+    """
+    if workers > 1:
+        # workers>1 はimport文字列が必要（uvicornの制約）
+        uvicorn.run(
+            "lark_master_mcp.bot_server:create_bot_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            loop=_LOOP,
+            http="httptools",
+            timeout_keep_alive=30,
+            limit_concurrency=1000,
+        )
+    else:
+        app = create_bot_app()
+        uvicorn.run(
+            app,
+            host=host,
+            port=port,
+            loop=_LOOP,
+            http="httptools",
+            timeout_keep_alive=30,
+            limit_concurrency=1000,
+        )
 
 
 if __name__ == "__main__":
@@ -3,38 +3,431 @@
 import asyncio
 import json
 import logging
+import os
+import random
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 import httpx
-from pydantic import BaseModel
+
+try:
+    # orjson（Rust実装）があればコンテンツのシリアライズに使用
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def _dumps_raw(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    def _dumps_raw(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+try:
+    # h2があればHTTP/2を有効化（単一ホストへの多重化でHoLブロッキング回避）
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _HTTP2_AVAILABLE = False
+
+# 接続確立段階の失敗はリクエスト未達なので非冪等メソッドでも再送して安全。
+# RemoteProtocolErrorはレスポンス側の破損（サーバーが処理済みの可能性あり）
+# のため、ReadTimeoutと同様にGET以外ではリトライしない。
+_RETRIABLE_EXC = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+)
 
 # Setup logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
-class LarkAuth(BaseModel):
-    """Lark authentication token holder."""
-    access_token: str
-    expires_at: int
+class LarkAPIError(Exception):
+    """Raised when a Lark API call fails (non-zero code or transport error).
+
+    Carries the numeric API code and endpoint so callers can branch on
+    them instead of parsing the message string.
+    """
+
+    def __init__(self, message: str, code: Optional[int] = None, endpoint: str = ""):
+        super().__init__(message)
+        self.code = code
+        self.endpoint = endpoint
+
+
+@lru_cache(maxsize=512)
+def _full_url(endpoint: str) -> httpx.URL:
+    """Cache the pre-parsed httpx.URL per endpoint string.
+
+    Returning an httpx.URL (not a str) lets the client skip URL parsing
+    and normalization on every request. Static endpoints (messages,
+    chats, auth, ...) resolve to the same object on every call;
+    parameterized endpoints are bounded by the cache size.
+    """
+    return httpx.URL(f"{LarkClient.BASE_URL}{endpoint}")
+
+# ホットなエンドポイントは.formatを束縛したテンプレートとして事前構築
+# （呼び出しごとのf-string評価を省き、文字列連結1回だけにする）
+_EP_BITABLE_TABLES = "/bitable/v1/apps/{}/tables".format
+_EP_BITABLE_RECORDS = "/bitable/v1/apps/{}/tables/{}/records".format
+_EP_BITABLE_BATCH_CREATE = "/bitable/v1/apps/{}/tables/{}/records/batch_create".format
+_EP_BITABLE_BATCH_UPDATE = "/bitable/v1/apps/{}/tables/{}/records/batch_update".format
+_EP_BITABLE_BATCH_DELETE = "/bitable/v1/apps/{}/tables/{}/records/batch_delete".format
+_EP_BITABLE_SEARCH = "/bitable/v1/apps/{}/tables/{}/records/search".format
+_EP_BITABLE_FIELDS = "/bitable/v1/apps/{}/tables/{}/fields".format
+_EP_BITABLE_FIELD = "/bitable/v1/apps/{}/tables/{}/fields/{}".format
+_EP_BITABLE_VIEWS = "/bitable/v1/apps/{}/tables/{}/views".format
+_EP_BITABLE_VIEW = "/bitable/v1/apps/{}/tables/{}/views/{}".format
+_EP_MINUTE = "/minutes/v1/minutes/{}".format
+_EP_MINUTE_TRANSCRIPT = "/minutes/v1/minutes/{}/transcript".format
+_EP_MINUTE_STATISTICS = "/minutes/v1/minutes/{}/statistics".format
+_EP_DOC_BLOCK_LOCK = "/docx/v1/documents/{}/blocks/{}/lock".format
+_EP_DOC_BLOCK_UNLOCK = "/docx/v1/documents/{}/blocks/{}/unlock".format
+_EP_OKR_PROGRESS = "/okr/v1/okrs/{}/key_results/{}/progress".format
+_EP_TASK = "/tasks/v1/tasks/{}".format
+_EP_APPROVAL_INSTANCE = "/approval/v4/instances/{}".format
+_EP_WIKI_PAGES = "/wiki/v2/spaces/{}/pages".format
+_EP_SHARE_SCREEN = "/vc/v1/meetings/{}/share_screen".format
+_EP_FILE_MEMBERS = "/drive/v1/permissions/{}/members".format
+
+
+def _user_attendees(
+    user_ids: Optional[List[Union[str, Dict[str, str]]]]
+) -> List[Dict[str, str]]:
+    """Build the calendar attendee payload shared by event methods.
+
+    Entries that are already payload-shaped dicts are passed through
+    untouched, so callers inviting the same large list repeatedly
+    (recurring events and the like) can build it once and reuse it
+    instead of re-allocating one dict per attendee on every call.
+    """
+    if not user_ids:
+        return []
+    if isinstance(user_ids[0], dict):
+        return user_ids
+    return [{"type": "user", "user_id": uid} for uid in user_ids]
+
+
+# 完全に不変なボディは一度だけ直列化してバイト列を再利用
+_ADD_BOT_BODY = _dumps_raw({"member_ids": ["bot"]})
+
+
+@lru_cache(maxsize=64)
+def _reaction_body(emoji_type: str) -> Dict[str, Dict[str, str]]:
+    """Reaction payload keyed by emoji type.
+
+    Reaction-heavy integrations cycle through a handful of emoji, so the
+    same nested dict is reused instead of allocating two dicts per call.
+    The request path treats payloads as immutable, which keeps this safe.
+    """
+    return {"reaction_type": {"emoji_type": emoji_type}}
+
+
+def _compact(**fields: Any) -> Dict[str, Any]:
+    """Build a payload dict keeping only the fields that are not None.
+
+    Replaces the `data = {}` + if-chain pattern in methods with many
+    optional parameters: one comprehension, no branches or dict resizes.
+    """
+    return {k: v for k, v in fields.items() if v is not None}
+
+
+class _TokenBucket:
+    """Client-side QPS gate that adapts to Lark's rate-limit headers.
+
+    Smooths bursts to a steady request rate so the app stays just below
+    its per-tenant quota instead of slamming into 429s and paying retry
+    delays. The refill rate follows the X-Ogw-Ratelimit-Limit response
+    header when Lark sends it.
+    """
+
+    def __init__(self, rate: float = 50.0, capacity: float = 100.0):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # 待機者はロックで直列化される＝概ねFIFOで公平に払い出される
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+    def update_from_headers(self, headers: Any) -> None:
+        """Adapt the refill rate to the quota Lark reports."""
+        limit = headers.get("x-ogw-ratelimit-limit")
+        if not limit:
+            return
+        try:
+            # クォータの9割で走って限界張り付きによる429を避ける
+            self.rate = max(1.0, float(limit) * 0.9)
+        except ValueError:
+            pass
+
+
+class _RecordBatcher:
+    """Coalesces single-record creates into batch_create round trips.
+
+    Calls arriving within a short window for the same (app_token, table_id)
+    are merged into one batch_create_records request; every caller gets its
+    own created record back through its own future.
+    """
+
+    WINDOW = 0.01  # seconds to wait for more records before flushing
+    MAX_BATCH = 500  # Lark batch_create limit per request
+
+    def __init__(self, client: "LarkClient"):
+        self._client = client
+        self._pending: Dict[tuple, List] = {}
+
+    def add(self, app_token: str, table_id: str, fields: Dict[str, Any]) -> "asyncio.Future":
+        key = (app_token, table_id)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        bucket = self._pending.get(key)
+        if bucket is None:
+            bucket = []
+            self._pending[key] = bucket
+            asyncio.ensure_future(self._flush_after_window(key))
+        bucket.append((fields, future))
+
+        if len(bucket) >= self.MAX_BATCH:
+            del self._pending[key]
+            asyncio.ensure_future(self._flush(key, bucket))
+
+        return future
+
+    async def _flush_after_window(self, key: tuple):
+        await asyncio.sleep(self.WINDOW)
+        bucket = self._pending.pop(key, None)
+        if bucket:
+            await self._flush(key, bucket)
+
+    async def _flush(self, key: tuple, bucket: List):
+        app_token, table_id = key
+        records = [{"fields": fields} for fields, _ in bucket]
+        try:
+            result = await self._client.batch_create_records(
+                app_token, table_id, records
+            )
+        except Exception as e:
+            for _, future in bucket:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # レスポンスのrecordsは送信順なので、各呼び出し元には自分の
+        # レコードだけを返す（形が想定外の場合のみ全体をそのまま返す）
+        records_out = result.get("records") if isinstance(result, dict) else None
+        aligned = isinstance(records_out, list) and len(records_out) == len(bucket)
+        for i, (_, future) in enumerate(bucket):
+            if not future.done():
+                future.set_result(records_out[i] if aligned else result)
+
+
+class _TTLCache:
+    """Short-TTL memoization for idempotent GET responses.
+
+    UI poll loops call the same read endpoints with identical arguments
+    many times per second; a few seconds of caching collapses those to
+    one network round trip. In-flight requests are shared, so concurrent
+    callers for the same key await a single fetch instead of stampeding
+    the API (followers are shielded from each other's cancellation).
+    """
+
+    def __init__(self, ttl: float = 5.0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[tuple, "asyncio.Task"] = {}
+
+    async def get_or_fetch(
+        self, key: tuple, fetch, ttl: Optional[float] = None
+    ) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            deadline, value = entry
+            if time.monotonic() < deadline:
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(fetch())
+        self._inflight[key] = task
+        try:
+            value = await task
+        finally:
+            self._inflight.pop(key, None)
+        self._entries[key] = (time.monotonic() + (ttl or self.ttl), value)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, *prefix: Any) -> None:
+        """Drop cached entries whose key starts with ``prefix``.
+
+        Mutators call this after a successful write so a just-made
+        update is never masked by a stale read inside the TTL window.
+        """
+        n = len(prefix)
+        stale = [k for k in self._entries if k[:n] == prefix]
+        for k in stale:
+            del self._entries[k]
 
 
 class LarkClient:
     """Client for Lark (Feishu) API operations."""
-    
+
+    __slots__ = (
+        "app_id",
+        "app_secret",
+        "access_token",
+        "_token_deadline",
+        "_auth_headers",
+        "_upload_headers",
+        "_auth_lock",
+        "_request_semaphore",
+        "_record_batcher",
+        "_bucket",
+        "_get_cache",
+        "_refresh_task",
+        "client",
+        "_owns_client",
+    )
+
     BASE_URL = "https://open.feishu.cn/open-apis"
-    
-    def __init__(self, app_id: str, app_secret: str):
+
+    # Connection pool tuning: everything goes to the same Lark host, so a
+    # generous warm keep-alive set avoids handshakes under fan-out load.
+    POOL_MAX_CONNECTIONS = 100
+    POOL_MAX_KEEPALIVE = 20
+    POOL_KEEPALIVE_EXPIRY = 30.0
+
+    # 同時インフライト上限（Feishuのレート制限前に自分から詰まらない値）
+    MAX_CONCURRENT_REQUESTS = 50
+
+    # 429/5xx時のリトライ設定（指数バックオフ）
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 0.5
+
+    def __init__(
+        self,
+        app_id: str,
+        app_secret: str,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.app_id = app_id
         self.app_secret = app_secret
-        self.auth: Optional[LarkAuth] = None
-        self.client = httpx.AsyncClient()
-    
+        # アクセストークンはプレーンなstrで保持（ホットパスで毎回触る
+        # だけの値にPydanticモデルは不要）
+        self.access_token: Optional[str] = None
+        # トークン失効期限（time.monotonic基準、壁時計の巻き戻り耐性）
+        self._token_deadline: float = 0.0
+        # 認証ヘッダーはトークン更新時に一度だけ構築して再利用
+        self._auth_headers: Dict[str, str] = {}
+        # multipart用（Content-Typeはhttpxに任せる）の認証のみヘッダー
+        self._upload_headers: Dict[str, str] = {}
+        # トークンリフレッシュのsingle-flight用ロック
+        self._auth_lock = asyncio.Lock()
+        # 同時リクエスト数を制限（直列化はせず上限のみ設ける）。
+        # バースト特性はデプロイ先で異なるため環境変数で上書き可能に
+        # しておく（プールサイズ以下に揃えるのが目安）。
+        try:
+            max_concurrency = int(
+                os.environ.get("LARK_MAX_CONCURRENCY", self.MAX_CONCURRENT_REQUESTS)
+            )
+        except ValueError:
+            max_concurrency = self.MAX_CONCURRENT_REQUESTS
+        self._request_semaphore = asyncio.Semaphore(max_concurrency)
+        # Bitableレコード作成のマイクロバッチ用（初回使用時に生成）
+        self._record_batcher: Optional[_RecordBatcher] = None
+        # 冪等なGETの短TTLメモ化（ポーリングの重複呼び出しを吸収）
+        self._get_cache = _TTLCache()
+        # トークンバケットでQPSを平滑化（429になる前に自分で抑える）
+        self._bucket = _TokenBucket()
+        # 失効前に裏でトークンを更新するバックグラウンドタスク
+        self._refresh_task: Optional["asyncio.Task"] = None
+        # 単一クライアントを全API呼び出しで再利用（keep-aliveで
+        # TLSハンドシェイクを接続ごとに1回に抑える）。リクエストごとに
+        # AsyncClientを作り直すとプールが毎回捨てられるので厳禁。
+        # 複数のSDKクライアントでプールを共有したいアプリは外から
+        # clientを渡せる（その場合closeの責任は渡した側にある）。
+        # トランスポートレベルの接続リトライで一時的な接続失敗を吸収
+        # 全エンドポイントが同一ホストなので、HTTP/2が使えれば1本の
+        # コネクション上に多重化してハンドシェイク/HoLブロッキングを削減
+        self._owns_client = client is None
+        self.client = client if client is not None else httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                connect=5.0, read=30.0, write=30.0, pool=5.0
+            ),
+            transport=httpx.AsyncHTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=self.POOL_MAX_CONNECTIONS,
+                    max_keepalive_connections=self.POOL_MAX_KEEPALIVE,
+                    keepalive_expiry=self.POOL_KEEPALIVE_EXPIRY,
+                ),
+            ),
+        )
+    
+    async def warmup(self) -> None:
+        """Open a connection eagerly to amortize the first TLS handshake.
+
+        The response status is irrelevant — reaching the server leaves a
+        warm keep-alive connection in the pool for the first real call.
+        Best-effort: failures are logged and ignored.
+        """
+        try:
+            await self.client.head(self.BASE_URL, timeout=5.0)
+        except Exception as e:
+            logger.debug("Connection warm-up failed: %s", e)
+
     async def _ensure_auth(self) -> str:
-        """Ensure we have a valid access token."""
-        if self.auth and self.auth.expires_at > int(time.time()):
-            return self.auth.access_token
-        
+        """Ensure we have a valid access token.
+
+        Concurrent callers coalesce behind a single refresh: the lock plus
+        the re-check means only the first waiter actually hits the auth
+        endpoint while the rest reuse the fresh token.
+        """
+        if self.access_token and time.monotonic() < self._token_deadline:
+            return self.access_token
+
+        async with self._auth_lock:
+            # Another coroutine may have refreshed while we waited.
+            if self.access_token and time.monotonic() < self._token_deadline:
+                return self.access_token
+            return await self._refresh_auth()
+
+    async def _refresh_auth(self) -> str:
+        """Fetch a new tenant access token (caller must hold _auth_lock)."""
         try:
             logger.info("Requesting new Lark access token...")
             # Get new access token
@@ -46,72 +439,170 @@ class LarkClient:
                 }
             )
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
             
             if data.get("code") != 0:
                 error_msg = f"Failed to get access token: {data.get('msg')}"
                 logger.error(error_msg)
-                raise Exception(error_msg)
+                raise LarkAPIError(error_msg, code=data.get("code"))
             
-            self.auth = LarkAuth(
-                access_token=data["tenant_access_token"],
-                expires_at=int(time.time()) + data["expire"] - 60  # 1 minute buffer
-            )
+            self.access_token = data["tenant_access_token"]
+            # 有効期限はmonotonic時刻の締切としてキャッシュ（1分のバッファ）
+            self._token_deadline = time.monotonic() + data["expire"] - 60
+            self._schedule_proactive_refresh()
+            # ヘッダーdictはここで一度だけ構築（リクエストごとの構築を回避）
+            self._auth_headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json"
+            }
+            self._upload_headers = {
+                "Authorization": f"Bearer {self.access_token}"
+            }
             logger.info("Successfully obtained new access token")
-            return self.auth.access_token
+            return self.access_token
             
         except httpx.HTTPError as e:
             error_msg = f"HTTP error during authentication: {str(e)}"
             logger.error(error_msg)
-            raise Exception(error_msg)
+            raise LarkAPIError(error_msg)
         except Exception as e:
             logger.error(f"Unexpected error during authentication: {str(e)}")
             raise
     
+    def _schedule_proactive_refresh(self):
+        """Schedule a background refresh shortly before token expiry.
+
+        Refreshing proactively means request coroutines almost never pay
+        the auth round trip inline; on failure the normal lazy path in
+        _ensure_auth still covers the next request.
+        """
+        current = asyncio.current_task()
+        if (
+            self._refresh_task
+            and not self._refresh_task.done()
+            and self._refresh_task is not current
+        ):
+            self._refresh_task.cancel()
+        self._refresh_task = asyncio.create_task(self._proactive_refresh())
+
+    async def _proactive_refresh(self):
+        delay = max(self._token_deadline - time.monotonic() - 120, 0)
+        await asyncio.sleep(delay)
+        try:
+            async with self._auth_lock:
+                await self._refresh_auth()
+        except Exception as e:
+            logger.warning("Proactive token refresh failed: %s", e)
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter so retries don't re-synchronize."""
+        base = self.RETRY_BASE_DELAY * (2 ** attempt)
+        return base + random.uniform(0, base * 0.25)
+
+    def _check_response(
+        self,
+        result: Dict[str, Any],
+        endpoint: str
+    ) -> Dict[str, Any]:
+        """Validate a Lark API envelope and unwrap its data payload."""
+        if result.get("code") != 0:
+            error_msg = (
+                f"API Error ({result.get('code')}): "
+                f"{result.get('msg', 'Unknown error')}"
+            )
+            logger.error(f"API Error for {endpoint}: {error_msg}")
+            raise LarkAPIError(error_msg, code=result.get("code"), endpoint=endpoint)
+        return result.get("data", {})
+
     async def _make_request(
         self, 
         method: str, 
         endpoint: str, 
-        data: Optional[Dict] = None,
-        params: Optional[Dict] = None
+        data: Optional[Union[Dict, bytes]] = None,
+        params: Optional[Union[Dict, List[Tuple[str, Any]]]] = None
     ) -> Dict[str, Any]:
-        """Make authenticated request to Lark API."""
+        """Make authenticated request to Lark API.
+
+        ``params`` accepts either a dict or a list of (key, value) pairs;
+        the list form lets httpx encode repeated query keys natively.
+        ``data`` may be pre-serialized bytes for invariant bodies, which
+        are sent as-is without re-encoding.
+        """
+        # 空のparamsはNoneに落としてhttpxのクエリエンコード処理を丸ごと回避
+        # （dataは空dictでも"{}"ボディとして意味を持つため触らない）
+        if not params:
+            params = None
+
+        # ボディは自前でorjsonエンコードしてcontentで送る（httpxのjson=は
+        # stdlib jsonに固定のため）。Content-Typeは_auth_headersが持つ。
+        if data is None or isinstance(data, bytes):
+            body = data
+        else:
+            body = _dumps_raw(data)
+
         try:
-            token = await self._ensure_auth()
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
-            url = f"{self.BASE_URL}{endpoint}"
-            logger.debug(f"Making {method} request to {url}")
+            await self._ensure_auth()
+            headers = self._auth_headers
+
+            url = _full_url(endpoint)
+            # ホットパスのDEBUGログはレベル確認してから発行
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                logger.debug("Making %s request to %s", method, url)
             
-            response = await self.client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=data,
-                params=params
-            )
+            for attempt in range(self.MAX_RETRIES + 1):
+                await self._bucket.acquire()
+                try:
+                    async with self._request_semaphore:
+                        response = await self.client.request(
+                            method=method,
+                            url=url,
+                            headers=headers,
+                            content=body,
+                            params=params
+                        )
+                except (httpx.RemoteProtocolError, *_RETRIABLE_EXC) as e:
+                    if (isinstance(e, httpx.RemoteProtocolError)
+                            and method != "GET"):
+                        raise
+                    if attempt >= self.MAX_RETRIES:
+                        raise
+                    delay = self._retry_delay(attempt)
+                    logger.warning(
+                        "Retrying %s %s after %s (attempt %d, %.1fs)",
+                        method, endpoint, type(e).__name__, attempt + 1, delay
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                self._bucket.update_from_headers(response.headers)
+
+                # レート制限・サーバーエラーは指数バックオフでリトライ
+                status = response.status_code
+                if (status == 429 or status >= 500) and attempt < self.MAX_RETRIES:
+                    delay = self._retry_delay(attempt)
+                    logger.warning(
+                        "Retrying %s %s after HTTP %s (attempt %d, %.1fs)",
+                        method, endpoint, status, attempt + 1, delay
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                break
             response.raise_for_status()
-            
-            result = response.json()
-            if result.get("code") != 0:
-                error_msg = f"API Error ({result.get('code')}): {result.get('msg', 'Unknown error')}"
-                logger.error(f"API Error for {endpoint}: {error_msg}")
-                raise Exception(error_msg)
-            
-            logger.debug(f"Successful API call to {endpoint}")
-            return result.get("data", {})
+
+            # orjsonでバイト列から直接デコード（response.json()より速い）
+            result = self._check_response(_loads(response.content), endpoint)
+            if debug_enabled:
+                logger.debug("Successful API call to %s", endpoint)
+            return result
             
         except httpx.HTTPError as e:
             error_msg = f"HTTP error for {endpoint}: {str(e)}"
             logger.error(error_msg)
-            raise Exception(error_msg)
+            raise LarkAPIError(error_msg, endpoint=endpoint)
         except json.JSONDecodeError as e:
             error_msg = f"Invalid JSON response from {endpoint}: {str(e)}"
             logger.error(error_msg)
-            raise Exception(error_msg)
+            raise LarkAPIError(error_msg, endpoint=endpoint)
         except Exception as e:
             logger.error(f"Unexpected error for {endpoint}: {str(e)}")
             raise
@@ -128,7 +619,7 @@ class LarkClient:
         data = {
             "receive_id": chat_id,
             "msg_type": message_type,
-            "content": json.dumps(content)
+            "content": _dumps(content)
         }
         
         return await self._make_request(
@@ -138,6 +629,110 @@ class LarkClient:
             params={"receive_id_type": "chat_id"}
         )
     
+    async def send_messages_many(
+        self,
+        chat_ids: List[str],
+        message: str,
+        message_type: str = "text"
+    ) -> List[Any]:
+        """Send the same message to many chats concurrently.
+
+        Fans out over the shared connection pool; in-flight concurrency is
+        bounded by the client-wide semaphore. Per-chat failures are
+        returned in place as exceptions instead of aborting the batch.
+        """
+        return await asyncio.gather(
+            *(
+                self.send_message(chat_id, message, message_type)
+                for chat_id in chat_ids
+            ),
+            return_exceptions=True,
+        )
+
+    async def batch_send_message(
+        self,
+        message: str,
+        user_ids: Optional[List[str]] = None,
+        department_ids: Optional[List[str]] = None,
+        message_type: str = "text"
+    ) -> Dict[str, Any]:
+        """Send one message to many users/departments in a single request.
+
+        Uses Lark's batch send endpoint, so N recipients cost one round
+        trip instead of N. Prefer this over fanning out send_message when
+        the content is identical; send_messages_many remains for per-chat
+        delivery where recipients are chats rather than users.
+        """
+        data = _compact(
+            msg_type=message_type,
+            content={"text": message} if message_type == "text" else message,
+            open_ids=user_ids,
+            department_ids=department_ids,
+        )
+        return await self._make_request(
+            "POST",
+            "/message/v4/batch_send/",
+            data=data
+        )
+
+    async def gather(self, *calls: Tuple[str, Dict[str, Any]]) -> List[Any]:
+        """Run independent API calls concurrently.
+
+        Each call is a ``(method_name, kwargs)`` pair resolved against this
+        client, e.g.::
+
+            await client.gather(
+                ("send_message", {"chat_id": cid, "content": "hi"}),
+                ("create_task", {"title": "follow up"}),
+            )
+
+        Results come back aligned to input order; a failed call yields its
+        exception in place rather than aborting the rest. N unrelated
+        operations cost max(latency) instead of sum(latency), bounded by
+        the client-wide request semaphore.
+        """
+        return await asyncio.gather(
+            *(getattr(self, name)(**kwargs) for name, kwargs in calls),
+            return_exceptions=True,
+        )
+
+    @staticmethod
+    def _resolve_ref(value: Any, results: List[Any]) -> Any:
+        """Resolve a "$<step>.<path>" placeholder against earlier results."""
+        if not (isinstance(value, str) and value.startswith("$")):
+            return value
+        index, _, path = value[1:].partition(".")
+        node = results[int(index)]
+        for part in path.split(".") if path else ():
+            node = node[part]
+        return node
+
+    async def pipeline(self, *steps: Tuple[str, Dict[str, Any]]) -> List[Any]:
+        """Run a dependent chain of API calls with client-side data flow.
+
+        Steps are ``(method_name, kwargs)`` pairs as in gather(), but a
+        string kwarg of the form ``"$<k>.<field>.<path>"`` is replaced
+        with the value at that path in step k's result just before the
+        step runs — so each follow-up request goes on the wire the
+        moment its input arrives, over the shared connection, e.g.::
+
+            app, table = await client.pipeline(
+                ("create_bitable_app", {"name": "CRM"}),
+                ("create_bitable_table", {
+                    "app_token": "$0.app.app_token", "name": "leads",
+                }),
+            )
+
+        For calls with no data dependency, use gather() instead.
+        """
+        results: List[Any] = []
+        for name, kwargs in steps:
+            resolved = {
+                k: self._resolve_ref(v, results) for k, v in kwargs.items()
+            }
+            results.append(await getattr(self, name)(**resolved))
+        return results
+
     async def create_calendar_event(
         self,
         title: str,
@@ -147,10 +742,6 @@ class LarkClient:
         description: str = ""
     ) -> Dict[str, Any]:
         """Create a calendar event."""
-        attendee_list = []
-        if attendees:
-            attendee_list = [{"type": "user", "user_id": uid} for uid in attendees]
-        
         data = {
             "summary": title,
             "description": description,
@@ -158,43 +749,60 @@ class LarkClient:
             "end_time": {"timestamp": end_time},
             "attendee_ability": "can_see_others",
             "free_busy_status": "busy",
-            "attendees": attendee_list
+            "attendees": _user_attendees(attendees)
         }
         
         return await self._make_request("POST", "/calendar/v4/calendars/primary/events", data=data)
     
     async def get_user_info(self, user_id: str) -> Dict[str, Any]:
-        """Get user information."""
-        return await self._make_request(
-            "GET",
-            f"/contact/v3/users/{user_id}",
-            params={"user_id_type": "user_id"}
+        """Get user information.
+
+        Profiles change rarely, so responses are cached for a minute;
+        repeated lookups by higher layers skip the round trip.
+        """
+        return await self._get_cache.get_or_fetch(
+            ("get_user_info", user_id),
+            lambda: self._make_request(
+                "GET",
+                f"/contact/v3/users/{user_id}",
+                params={"user_id_type": "user_id"}
+            ),
+            ttl=60.0,
         )
     
     async def list_chats(self) -> Dict[str, Any]:
-        """List all chats the bot has access to."""
-        return await self._make_request("GET", "/im/v1/chats")
+        """List all chats the bot has access to (cached for a minute)."""
+        return await self._get_cache.get_or_fetch(
+            ("list_chats",),
+            lambda: self._make_request("GET", "/im/v1/chats"),
+            ttl=60.0,
+        )
     
     async def upload_file(self, file_path: str, file_type: str) -> Dict[str, Any]:
-        """Upload a file to Lark."""
-        with open(file_path, "rb") as f:
-            files = {"file": f}
-            token = await self._ensure_auth()
+        """Upload a file to Lark.
+
+        The open file handle is handed to httpx, which streams the
+        multipart body in chunks instead of buffering the file in memory.
+        open()自体もブロッキングI/O（ネットワークFSでは特に）なので
+        ワーカースレッドに逃がしてイベントループを止めない。
+        """
+        f = await asyncio.to_thread(open, file_path, "rb")
+        try:
+            files = {"file": (os.path.basename(file_path), f)}
+            await self._ensure_auth()
             
             # Use form data for file upload
             response = await self.client.post(
                 f"{self.BASE_URL}/im/v1/files",
-                headers={"Authorization": f"Bearer {token}"},
+                headers=self._upload_headers,
                 files=files,
                 data={"file_type": file_type}
             )
             response.raise_for_status()
-            
-            result = response.json()
-            if result.get("code") != 0:
-                raise Exception(f"Upload failed: {result.get('msg')}")
-            
-            return result.get("data", {})
+
+            return self._check_response(_loads(response.content), "/im/v1/files")
+        finally:
+            await asyncio.to_thread(f.close)
     
     async def create_document(
         self, 
@@ -246,11 +854,15 @@ class LarkClient:
         return await self._make_request("GET", "/im/v1/messages/search", params=params)
     
     async def get_department_users(self, department_id: str) -> Dict[str, Any]:
-        """Get users in a department."""
-        return await self._make_request(
-            "GET",
-            "/contact/v3/users",
-            params={"department_id": department_id}
+        """Get users in a department (roster cached for a minute)."""
+        return await self._get_cache.get_or_fetch(
+            ("get_department_users", department_id),
+            lambda: self._make_request(
+                "GET",
+                "/contact/v3/users",
+                params={"department_id": department_id}
+            ),
+            ttl=60.0,
         )
     
     async def create_meeting(
@@ -279,17 +891,26 @@ class LarkClient:
         return await self._make_request("POST", "/vc/v1/meetings", data=data)
     
     async def get_spreadsheet_data(
-        self, 
-        spreadsheet_token: str, 
-        range_: str = ""
+        self,
+        spreadsheet_token: str,
+        range_: Union[str, List[str]] = ""
     ) -> Dict[str, Any]:
-        """Get data from a spreadsheet."""
+        """Get data from a spreadsheet.
+
+        ``range_`` may be a single A1-style range or a list of them; the
+        underlying values_batch_get endpoint reads all ranges in one
+        round trip, so prefer one call with several ranges over several
+        calls with one.
+        """
         endpoint = f"/sheets/v4/spreadsheets/{spreadsheet_token}/values_batch_get"
         params = {}
-        
+
         if range_:
-            params["ranges"] = range_
-        
+            if isinstance(range_, list):
+                params["ranges"] = ",".join(range_)
+            else:
+                params["ranges"] = range_
+
         return await self._make_request("GET", endpoint, params=params)
     
     async def update_spreadsheet_data(
@@ -343,7 +964,7 @@ class LarkClient:
             
         return await self._make_request(
             "PATCH",
-            f"/tasks/v1/tasks/{task_id}",
+            _EP_TASK(task_id),
             data=data
         )
     
@@ -370,7 +991,7 @@ class LarkClient:
         """Get approval status."""
         return await self._make_request(
             "GET",
-            f"/approval/v4/instances/{instance_id}"
+            _EP_APPROVAL_INSTANCE(instance_id)
         )
     
     async def transfer_approval(
@@ -485,17 +1106,19 @@ class LarkClient:
             
         return await self._make_request(
             "POST",
-            f"/wiki/v2/spaces/{space_id}/pages",
+            _EP_WIKI_PAGES(space_id),
             data=data
         )
     
     async def add_bot_to_chat(self, chat_id: str) -> Dict[str, Any]:
         """Add bot to chat."""
-        return await self._make_request(
+        result = await self._make_request(
             "POST",
             f"/im/v1/chats/{chat_id}/members",
-            data={"member_ids": ["bot"]}
+            data=_ADD_BOT_BODY
         )
+        self._get_cache.invalidate("get_chat_members", chat_id)
+        return result
     
     async def create_chat_group(
         self,
@@ -513,14 +1136,19 @@ class LarkClient:
             data["member_ids"] = member_ids
         if owner_id:
             data["owner_id"] = owner_id
-            
-        return await self._make_request("POST", "/im/v1/chats", data=data)
+
+        result = await self._make_request("POST", "/im/v1/chats", data=data)
+        self._get_cache.invalidate("list_chats")
+        return result
     
     async def get_chat_members(self, chat_id: str) -> Dict[str, Any]:
-        """Get chat members."""
-        return await self._make_request(
-            "GET",
-            f"/im/v1/chats/{chat_id}/members"
+        """Get chat members (cached for a minute)."""
+        return await self._get_cache.get_or_fetch(
+            ("get_chat_members", chat_id),
+            lambda: self._make_request(
+                "GET", f"/im/v1/chats/{chat_id}/members"
+            ),
+            ttl=60.0,
         )
     
     async def create_leave_request(
@@ -550,11 +1178,10 @@ class LarkClient:
         end_date: str
     ) -> Dict[str, Any]:
         """Get attendance records."""
-        params = {
-            "user_ids": ",".join(user_ids),
-            "start_date": start_date,
-            "end_date": end_date
-        }
+        # httpxの多値パラメータ形式（","結合の中間文字列を作らない）
+        params = [("user_ids", uid) for uid in user_ids]
+        params.append(("start_date", start_date))
+        params.append(("end_date", end_date))
         return await self._make_request(
             "GET",
             "/attendance/v1/records",
@@ -591,7 +1218,7 @@ class LarkClient:
         data = {"share_type": share_type}
         return await self._make_request(
             "POST",
-            f"/vc/v1/meetings/{meeting_id}/share_screen",
+            _EP_SHARE_SCREEN(meeting_id),
             data=data
         )
     
@@ -640,20 +1267,33 @@ class LarkClient:
     async def share_file(
         self,
         file_token: str,
-        user_ids: List[str],
+        user_ids: List[Union[str, Dict[str, str]]],
         permission: str = "view",
         notify: bool = True
     ) -> Dict[str, Any]:
-        """Share a file with users."""
+        """Share a file with users.
+
+        As with calendar attendees, entries that are already
+        payload-shaped dicts pass through unchanged so a stable member
+        list can be built once and reused across calls.
+        """
+        if user_ids and isinstance(user_ids[0], dict):
+            members = user_ids
+        else:
+            members = [
+                {"member_id": uid, "perm": permission} for uid in user_ids
+            ]
         data = {
-            "members": [{"member_id": uid, "perm": permission} for uid in user_ids],
+            "members": members,
             "notify": notify
         }
-        return await self._make_request(
+        result = await self._make_request(
             "POST",
-            f"/drive/v1/permissions/{file_token}/members",
+            _EP_FILE_MEMBERS(file_token),
             data=data
         )
+        self._get_cache.invalidate("get_file_permissions", file_token)
+        return result
     
     async def search_wiki(
         self,
@@ -714,10 +1354,25 @@ class LarkClient:
         records: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Batch create records in Bitable."""
-        endpoint = f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/batch_create"
+        endpoint = _EP_BITABLE_BATCH_CREATE(app_token, table_id)
         data = {"records": records}
         return await self._make_request("POST", endpoint, data=data)
     
+    async def create_record(
+        self,
+        app_token: str,
+        table_id: str,
+        fields: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Create a single record, coalesced into a batch round trip.
+
+        Concurrent calls against the same table within a ~10ms window are
+        merged into one batch_create_records request.
+        """
+        if self._record_batcher is None:
+            self._record_batcher = _RecordBatcher(self)
+        return await self._record_batcher.add(app_token, table_id, fields)
+
     async def batch_update_records(
         self,
         app_token: str,
@@ -725,7 +1380,7 @@ class LarkClient:
         records: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Batch update records in Bitable."""
-        endpoint = f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/batch_update"
+        endpoint = _EP_BITABLE_BATCH_UPDATE(app_token, table_id)
         data = {"records": records}
         return await self._make_request("POST", endpoint, data=data)
     
@@ -735,12 +1390,12 @@ class LarkClient:
         mobiles: List[str] = None
     ) -> Dict[str, Any]:
         """Get user by email or phone."""
-        params = {}
+        params: List[Tuple[str, Any]] = []
         if emails:
-            params["emails"] = ",".join(emails)
+            params.extend(("emails", email) for email in emails)
         if mobiles:
-            params["mobiles"] = ",".join(mobiles)
-        
+            params.extend(("mobiles", mobile) for mobile in mobiles)
+
         return await self._make_request("GET", "/contact/v3/users/batch", params=params)
     
     async def search_documents(
@@ -751,14 +1406,14 @@ class LarkClient:
         chat_ids: List[str] = None
     ) -> Dict[str, Any]:
         """Search documents."""
-        params = {"query": query}
+        params: List[Tuple[str, Any]] = [("query", query)]
         if doc_types:
-            params["doc_types"] = ",".join(doc_types)
+            params.extend(("doc_types", t) for t in doc_types)
         if owner_ids:
-            params["owner_ids"] = ",".join(owner_ids)
+            params.extend(("owner_ids", oid) for oid in owner_ids)
         if chat_ids:
-            params["chat_ids"] = ",".join(chat_ids)
-            
+            params.extend(("chat_ids", cid) for cid in chat_ids)
+
         return await self._make_request("GET", "/suite/docs-api/search/object", params=params)
     
     async def import_document(
@@ -767,10 +1422,16 @@ class LarkClient:
         file_type: str,
         folder_token: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Import document to Lark Docs."""
-        with open(file_path, "rb") as f:
-            files = {"file": f}
-            token = await self._ensure_auth()
+        """Import document to Lark Docs.
+
+        Like upload_file, the handle is streamed chunk-wise by httpx
+        rather than read into memory up front, and opened/closed in a
+        worker thread to keep blocking file I/O off the event loop.
+        """
+        f = await asyncio.to_thread(open, file_path, "rb")
+        try:
+            files = {"file": (os.path.basename(file_path), f)}
+            await self._ensure_auth()
             
             params = {"type": file_type}
             if folder_token:
@@ -778,17 +1439,17 @@ class LarkClient:
                 
             response = await self.client.post(
                 f"{self.BASE_URL}/drive/v1/import_tasks/import_user_file",
-                headers={"Authorization": f"Bearer {token}"},
+                headers=self._upload_headers,
                 files=files,
                 params=params
             )
             response.raise_for_status()
-            
-            result = response.json()
-            if result.get("code") != 0:
-                raise Exception(f"Import failed: {result.get('msg')}")
-            
-            return result.get("data", {})
+
+            return self._check_response(
+                _loads(response.content), "/drive/v1/import_tasks/import_user_file"
+            )
+        finally:
+            await asyncio.to_thread(f.close)
     
     async def export_document(
         self,
@@ -868,7 +1529,7 @@ class LarkClient:
         fields: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Create a new table in Bitable."""
-        endpoint = f"/bitable/v1/apps/{app_token}/tables"
+        endpoint = _EP_BITABLE_TABLES(app_token)
         data = {
             "table": {
                 "name": name,
@@ -885,12 +1546,14 @@ class LarkClient:
         view_type: str = "grid"
     ) -> Dict[str, Any]:
         """Create a view in Bitable table."""
-        endpoint = f"/bitable/v1/apps/{app_token}/tables/{table_id}/views"
+        endpoint = _EP_BITABLE_VIEWS(app_token, table_id)
         data = {
             "view_name": view_name,
             "view_type": view_type
         }
-        return await self._make_request("POST", endpoint, data=data)
+        result = await self._make_request("POST", endpoint, data=data)
+        self._get_cache.invalidate("get_bitable_views", app_token, table_id)
+        return result
     
     async def add_bitable_field(
         self,
@@ -900,7 +1563,7 @@ class LarkClient:
         field_type: str
     ) -> Dict[str, Any]:
         """Add a field to Bitable table."""
-        endpoint = f"/bitable/v1/apps/{app_token}/tables/{table_id}/fields"
+        endpoint = _EP_BITABLE_FIELDS(app_token, table_id)
         data = {
             "field_name": field_name,
             "type": field_type
@@ -915,7 +1578,7 @@ class LarkClient:
         filter: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """Get records from Bitable table."""
-        endpoint = f"/bitable/v1/apps/{app_token}/tables/{table_id}/records"
+        endpoint = _EP_BITABLE_RECORDS(app_token, table_id)
         params = {}
         if view_id:
             params["view_id"] = view_id
@@ -930,7 +1593,7 @@ class LarkClient:
         record_ids: List[str]
     ) -> Dict[str, Any]:
         """Delete records from Bitable."""
-        endpoint = f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/batch_delete"
+        endpoint = _EP_BITABLE_BATCH_DELETE(app_token, table_id)
         data = {"records": record_ids}
         return await self._make_request("POST", endpoint, data=data)
     
@@ -943,7 +1606,7 @@ class LarkClient:
         field_names: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Search Bitable records with advanced filtering and sorting."""
-        endpoint = f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/search"
+        endpoint = _EP_BITABLE_SEARCH(app_token, table_id)
         data = {}
         if filter_info:
             data["filter"] = filter_info
@@ -959,7 +1622,7 @@ class LarkClient:
         table_id: str
     ) -> Dict[str, Any]:
         """Get all fields information from Bitable table."""
-        endpoint = f"/bitable/v1/apps/{app_token}/tables/{table_id}/fields"
+        endpoint = _EP_BITABLE_FIELDS(app_token, table_id)
         return await self._make_request("GET", endpoint)
     
     async def update_bitable_field(
@@ -971,12 +1634,8 @@ class LarkClient:
         property: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """Update Bitable field properties."""
-        endpoint = f"/bitable/v1/apps/{app_token}/tables/{table_id}/fields/{field_id}"
-        data = {}
-        if field_name:
-            data["field_name"] = field_name
-        if property:
-            data["property"] = property
+        endpoint = _EP_BITABLE_FIELD(app_token, table_id, field_id)
+        data = _compact(field_name=field_name, property=property)
         return await self._make_request("PATCH", endpoint, data=data)
     
     async def create_bitable_app(
@@ -997,8 +1656,11 @@ class LarkClient:
         table_id: str
     ) -> Dict[str, Any]:
         """Get all views from Bitable table."""
-        endpoint = f"/bitable/v1/apps/{app_token}/tables/{table_id}/views"
-        return await self._make_request("GET", endpoint)
+        endpoint = _EP_BITABLE_VIEWS(app_token, table_id)
+        return await self._get_cache.get_or_fetch(
+            ("get_bitable_views", app_token, table_id),
+            lambda: self._make_request("GET", endpoint),
+        )
     
     async def update_bitable_view(
         self,
@@ -1009,13 +1671,11 @@ class LarkClient:
         property: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """Update Bitable view."""
-        endpoint = f"/bitable/v1/apps/{app_token}/tables/{table_id}/views/{view_id}"
-        data = {}
-        if view_name:
-            data["view_name"] = view_name
-        if property:
-            data["property"] = property
-        return await self._make_request("PATCH", endpoint, data=data)
+        endpoint = _EP_BITABLE_VIEW(app_token, table_id, view_id)
+        data = _compact(view_name=view_name, property=property)
+        result = await self._make_request("PATCH", endpoint, data=data)
+        self._get_cache.invalidate("get_bitable_views", app_token, table_id)
+        return result
     
     # Messaging Additional Tools
     async def reply_message(
@@ -1026,7 +1686,7 @@ class LarkClient:
     ) -> Dict[str, Any]:
         """Reply to a message."""
         data = {
-            "content": json.dumps({"text": content}) if message_type == "text" else content,
+            "content": _dumps({"text": content}) if message_type == "text" else content,
             "msg_type": message_type
         }
         return await self._make_request(
@@ -1044,7 +1704,7 @@ class LarkClient:
         return await self._make_request(
             "POST",
             f"/im/v1/messages/{message_id}/reactions",
-            data={"reaction_type": {"emoji_type": emoji_type}}
+            data=_reaction_body(emoji_type)
         )
     
     async def delete_message_reaction(
@@ -1092,6 +1752,38 @@ class LarkClient:
             data={"receive_id": receive_id}
         )
     
+    async def add_reactions_many(
+        self,
+        message_ids: List[str],
+        emoji_type: str
+    ) -> List[Any]:
+        """Add the same reaction to many messages concurrently.
+
+        Follows the send_messages_many pattern: bounded fan-out with
+        per-message failures returned in place as exceptions.
+        """
+        return await asyncio.gather(
+            *(
+                self.add_message_reaction(message_id, emoji_type)
+                for message_id in message_ids
+            ),
+            return_exceptions=True,
+        )
+
+    async def forward_messages_many(
+        self,
+        message_ids: List[str],
+        receive_id: str
+    ) -> List[Any]:
+        """Forward many messages to one chat concurrently."""
+        return await asyncio.gather(
+            *(
+                self.forward_message(message_id, receive_id)
+                for message_id in message_ids
+            ),
+            return_exceptions=True,
+        )
+
     async def send_urgent_message(
         self,
         chat_id: str,
@@ -1101,7 +1793,7 @@ class LarkClient:
         """Send urgent message with notification."""
         data = {
             "receive_id": chat_id,
-            "content": json.dumps({"text": message}),
+            "content": _dumps({"text": message}),
             "msg_type": "text",
             "urgent_type": "urgent",
             "urgent_users": urgent_users
@@ -1156,16 +1848,12 @@ class LarkClient:
         attendees: List[str] = None
     ) -> Dict[str, Any]:
         """Create recurring calendar event."""
-        attendee_list = []
-        if attendees:
-            attendee_list = [{"type": "user", "user_id": uid} for uid in attendees]
-            
         data = {
             "summary": title,
             "start_time": {"timestamp": start_time},
             "end_time": {"timestamp": end_time},
             "recurrence": recurrence,
-            "attendees": attendee_list
+            "attendees": _user_attendees(attendees)
         }
         return await self._make_request(
             "POST",
@@ -1228,9 +1916,7 @@ class LarkClient:
         reason: Optional[str] = None
     ) -> Dict[str, Any]:
         """Decline calendar event invitation."""
-        data = {}
-        if reason:
-            data["reason"] = reason
+        data = _compact(reason=reason)
         return await self._make_request(
             "POST",
             f"/calendar/v4/calendars/primary/events/{event_id}/decline",
@@ -1248,20 +1934,24 @@ class LarkClient:
         data = {"content": content}
         if reply_to:
             data["reply_to"] = reply_to
-        return await self._make_request(
+        result = await self._make_request(
             "POST",
             f"/docx/v1/documents/{document_id}/comments",
             data=data
         )
+        self._get_cache.invalidate("get_document_comments", document_id)
+        return result
     
     async def get_document_comments(
         self,
         document_id: str
     ) -> Dict[str, Any]:
         """Get document comments."""
-        return await self._make_request(
-            "GET",
-            f"/docx/v1/documents/{document_id}/comments"
+        return await self._get_cache.get_or_fetch(
+            ("get_document_comments", document_id),
+            lambda: self._make_request(
+                "GET", f"/docx/v1/documents/{document_id}/comments"
+            ),
         )
     
     async def create_document_from_template(
@@ -1271,12 +1961,9 @@ class LarkClient:
         folder_token: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create document from template."""
-        data = {
-            "template_id": template_id,
-            "title": title
-        }
-        if folder_token:
-            data["folder_token"] = folder_token
+        data = _compact(
+            template_id=template_id, title=title, folder_token=folder_token
+        )
         return await self._make_request(
             "POST",
             "/docx/v1/documents/create_from_template",
@@ -1291,7 +1978,7 @@ class LarkClient:
         """Lock a section of document for editing."""
         return await self._make_request(
             "POST",
-            f"/docx/v1/documents/{document_id}/blocks/{block_id}/lock"
+            _EP_DOC_BLOCK_LOCK(document_id, block_id)
         )
     
     async def unlock_document_section(
@@ -1302,7 +1989,7 @@ class LarkClient:
         """Unlock a section of document."""
         return await self._make_request(
             "POST",
-            f"/docx/v1/documents/{document_id}/blocks/{block_id}/unlock"
+            _EP_DOC_BLOCK_UNLOCK(document_id, block_id)
         )
     
     async def subscribe_document_changes(
@@ -1338,13 +2025,9 @@ class LarkClient:
         avatar_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """Update bot information."""
-        data = {}
-        if name:
-            data["app_name"] = name
-        if description:
-            data["description"] = description
-        if avatar_key:
-            data["avatar_key"] = avatar_key
+        data = _compact(
+            app_name=name, description=description, avatar_key=avatar_key
+        )
         return await self._make_request(
             "POST",
             "/bot/v3/info/update",
@@ -1391,12 +2074,12 @@ class LarkClient:
         event_types: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Get audit logs."""
-        params = {
-            "start_time": start_time,
-            "end_time": end_time
-        }
+        params: List[Tuple[str, Any]] = [
+            ("start_time", start_time),
+            ("end_time", end_time)
+        ]
         if event_types:
-            params["event_types"] = ",".join(event_types)
+            params.extend(("event_types", et) for et in event_types)
         return await self._make_request(
             "GET",
             "/admin/v1/audit_logs",
@@ -1517,14 +2200,10 @@ class LarkClient:
         comment: Optional[str] = None
     ) -> Dict[str, Any]:
         """Update OKR progress."""
-        data = {
-            "progress": progress
-        }
-        if comment:
-            data["comment"] = comment
+        data = _compact(progress=progress, comment=comment)
         return await self._make_request(
             "POST",
-            f"/okr/v1/okrs/{okr_id}/key_results/{key_result_id}/progress",
+            _EP_OKR_PROGRESS(okr_id, key_result_id),
             data=data
         )
     
@@ -1555,11 +2234,7 @@ class LarkClient:
         end_time: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get form responses."""
-        params = {}
-        if start_time:
-            params["start_time"] = start_time
-        if end_time:
-            params["end_time"] = end_time
+        params = _compact(start_time=start_time, end_time=end_time)
         return await self._make_request(
             "GET",
             f"/form/v1/forms/{form_id}/responses",
@@ -1575,14 +2250,17 @@ class LarkClient:
         priority: str = "normal"
     ) -> Dict[str, Any]:
         """Create a helpdesk ticket."""
-        data = {
-            "subject": title,
-            "description": description,
-            "priority": priority
-        }
-        if category:
-            data["category"] = category
-        return await self._make_request("POST", "/helpdesk/v1/tickets", data=data)
+        data = _compact(
+            subject=title,
+            description=description,
+            priority=priority,
+            category=category,
+        )
+        result = await self._make_request(
+            "POST", "/helpdesk/v1/tickets", data=data
+        )
+        self._get_cache.invalidate("list_helpdesk_tickets")
+        return result
     
     async def get_helpdesk_ticket(
         self,
@@ -1602,18 +2280,14 @@ class LarkClient:
         comment: Optional[str] = None
     ) -> Dict[str, Any]:
         """Update helpdesk ticket."""
-        data = {}
-        if status:
-            data["status"] = status
-        if assignee:
-            data["assignee"] = assignee
-        if comment:
-            data["comment"] = comment
-        return await self._make_request(
+        data = _compact(status=status, assignee=assignee, comment=comment)
+        result = await self._make_request(
             "PATCH",
             f"/helpdesk/v1/tickets/{ticket_id}",
             data=data
         )
+        self._get_cache.invalidate("list_helpdesk_tickets")
+        return result
     
     async def list_helpdesk_tickets(
         self,
@@ -1621,15 +2295,12 @@ class LarkClient:
         assignee: Optional[str] = None
     ) -> Dict[str, Any]:
         """List helpdesk tickets."""
-        params = {}
-        if status:
-            params["status"] = status
-        if assignee:
-            params["assignee"] = assignee
-        return await self._make_request(
-            "GET",
-            "/helpdesk/v1/tickets",
-            params=params
+        params = _compact(status=status, assignee=assignee)
+        return await self._get_cache.get_or_fetch(
+            ("list_helpdesk_tickets", status, assignee),
+            lambda: self._make_request(
+                "GET", "/helpdesk/v1/tickets", params=params
+            ),
         )
     
     # Drive Advanced Operations
@@ -1643,20 +2314,24 @@ class LarkClient:
         data = {"parent_type": parent_type}
         if name:
             data["name"] = name
-        return await self._make_request(
+        result = await self._make_request(
             "POST",
             f"/drive/v1/files/{file_token}/versions",
             data=data
         )
+        self._get_cache.invalidate("get_file_versions", file_token)
+        return result
     
     async def get_file_versions(
         self,
         file_token: str
     ) -> Dict[str, Any]:
         """Get file version history."""
-        return await self._make_request(
-            "GET",
-            f"/drive/v1/files/{file_token}/versions"
+        return await self._get_cache.get_or_fetch(
+            ("get_file_versions", file_token),
+            lambda: self._make_request(
+                "GET", f"/drive/v1/files/{file_token}/versions"
+            ),
         )
     
     async def update_file_permission(
@@ -1667,11 +2342,13 @@ class LarkClient:
     ) -> Dict[str, Any]:
         """Update file permission."""
         data = {"role": role}
-        return await self._make_request(
+        result = await self._make_request(
             "PUT",
             f"/drive/v1/permissions/{file_token}/members/{permission_id}",
             data=data
         )
+        self._get_cache.invalidate("get_file_permissions", file_token)
+        return result
     
     async def get_file_permissions(
         self,
@@ -1680,10 +2357,13 @@ class LarkClient:
     ) -> Dict[str, Any]:
         """Get file permissions."""
         params = {"type": type}
-        return await self._make_request(
-            "GET",
-            f"/drive/v1/permissions/{file_token}/members",
-            params=params
+        return await self._get_cache.get_or_fetch(
+            ("get_file_permissions", file_token, type),
+            lambda: self._make_request(
+                "GET",
+                f"/drive/v1/permissions/{file_token}/members",
+                params=params,
+            ),
         )
     
     # ===== Minutes (議事録) API =====
@@ -1701,9 +2381,9 @@ class LarkClient:
         Returns:
             Minute metadata including title, owner, create_time, etc.
         """
-        return await self._make_request(
-            "GET",
-            f"/minutes/v1/minutes/{minute_token}"
+        return await self._get_cache.get_or_fetch(
+            ("get_minute", minute_token),
+            lambda: self._make_request("GET", _EP_MINUTE(minute_token)),
         )
 
     async def get_minute_transcript(
@@ -1721,7 +2401,7 @@ class LarkClient:
         """
         return await self._make_request(
             "GET",
-            f"/minutes/v1/minutes/{minute_token}/transcript"
+            _EP_MINUTE_TRANSCRIPT(minute_token)
         )
 
     async def get_minute_statistics(
@@ -1737,33 +2417,69 @@ class LarkClient:
         Returns:
             Statistics including speaker duration, word count, etc.
         """
-        return await self._make_request(
-            "GET",
-            f"/minutes/v1/minutes/{minute_token}/statistics"
+        return await self._get_cache.get_or_fetch(
+            ("get_minute_statistics", minute_token),
+            lambda: self._make_request(
+                "GET", _EP_MINUTE_STATISTICS(minute_token)
+            ),
         )
 
+    async def iter_minute_transcript(self, minute_token: str):
+        """
+        Yield transcript segments one at a time for large minutes.
+
+        The body is streamed into a single buffer in 64KB chunks instead
+        of going through _make_request's whole-response handling, and
+        segments are yielded lazily so summarizers or UIs that only need
+        the first K segments stop before touching the rest. (Parsing
+        itself happens once the download completes; incremental JSON
+        parsing would need an extra dependency like ijson.)
+
+        Args:
+            minute_token: The token of the minute
+
+        Yields:
+            One transcript segment dict at a time
+        """
+        await self._ensure_auth()
+        endpoint = _EP_MINUTE_TRANSCRIPT(minute_token)
+        buf = bytearray()
+        async with self._request_semaphore:
+            async with self.client.stream(
+                "GET", _full_url(endpoint), headers=self._auth_headers
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(65536):
+                    buf.extend(chunk)
+
+        result = self._check_response(_loads(bytes(buf)), endpoint)
+        for segment in result.get("segments") or []:
+            yield segment
+
     # ===== Interactive Message (インタラクティブメッセージ) =====
 
     async def send_interactive_message(
         self,
         chat_id: str,
-        card: Dict[str, Any]
+        card: Union[Dict[str, Any], str]
     ) -> Dict[str, Any]:
         """
         Send an interactive card message with buttons.
 
         Args:
             chat_id: The chat ID to send to
-            card: The card content (Lark Message Card format)
+            card: The card content (Lark Message Card format), either a
+                dict or an already-serialized JSON string. Apps reusing
+                card templates can pre-serialize once and skip the
+                per-send encode.
 
         Returns:
             API response with message_id
         """
-        import json
         data = {
             "receive_id": chat_id,
             "msg_type": "interactive",
-            "content": json.dumps(card)
+            "content": card if isinstance(card, str) else _dumps(card)
         }
         return await self._make_request(
             "POST",
@@ -1775,21 +2491,21 @@ class LarkClient:
     async def update_interactive_message(
         self,
         message_id: str,
-        card: Dict[str, Any]
+        card: Union[Dict[str, Any], str]
     ) -> Dict[str, Any]:
         """
         Update an existing interactive card message.
 
         Args:
             message_id: The message ID to update
-            card: The new card content
+            card: The new card content (dict or pre-serialized JSON
+                string, as in send_interactive_message)
 
         Returns:
             API response
         """
-        import json
         data = {
-            "content": json.dumps(card)
+            "content": card if isinstance(card, str) else _dumps(card)
         }
         return await self._make_request(
             "PATCH",
@@ -1797,6 +2513,34 @@ class LarkClient:
             data=data
         )
 
+    async def __aenter__(self) -> "LarkClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
\ No newline at end of file
+        """Close the HTTP client (unless it was supplied externally)."""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        if self._owns_client:
+            await self.client.aclose()
+
+# プロセス全体で使い回す共有クライアント（資格情報ごとに1つ）
+_client_instances: Dict[Tuple[str, str], "LarkClient"] = {}
+
+
+def get_client(app_id: str, app_secret: str) -> "LarkClient":
+    """Return the shared LarkClient for a credential pair.
+
+    Creating a client per request throws away the connection pool, the
+    auth token, and every cache each time. Code paths that cannot easily
+    thread one instance through should call this instead of the
+    constructor; repeated calls with the same credentials return the
+    same instance.
+    """
+    key = (app_id, app_secret)
+    client = _client_instances.get(key)
+    if client is None:
+        client = _client_instances[key] = LarkClient(app_id, app_secret)
+    return client
@@ -1,14 +1,89 @@
 """Message Handler - Larkメッセージを解析してMCPツールを実行"""
 
-import json
 import logging
+import random
 import re
 from typing import Any, Dict, List, Optional, Tuple, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
+from functools import lru_cache
+
+try:
+    # orjson（Rust実装）があればWebhookペイロードの解析に使用
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover
+    from json import loads as _loads
 
 logger = logging.getLogger(__name__)
 
+# ホットパスで使う正規表現はインポート時にコンパイルしておく
+# （re.search(str, ...)はモジュールキャッシュの辞書引きを毎回払う）
+_MENTION_RE = re.compile(r"@\w+")
+_FIELD_SPLIT_RE = re.compile(r"[,、，]")
+_TEST_RE = re.compile(r"テスト|test|聞こえ|返事|応答", re.IGNORECASE)
+
+_HELP_TEMPLATES = (
+    "顧客管理", "プロジェクト管理", "在庫管理", "売上管理",
+    "イベント管理", "採用管理", "問い合わせ管理", "会議メモ",
+)
+
+# 挨拶・テスト応答も毎回生成する必要がない定型文なので定数化
+_RNG = random.Random()
+
+_GREETINGS = (
+    "こんにちは！LarkMasterMCP Botです。何かお手伝いできることはありますか？",
+    "はい！何でもお聞きください。Bitableの作成やドキュメント管理などお手伝いします。",
+    "お呼びですか？「ヘルプ」で私にできることを確認できます！",
+)
+
+_TEST_RESPONSE = """📡 はい、聞こえています！
+
+LarkMasterMCP Bot が正常に動作しています。
+
+私にできることの例：
+• 「顧客管理テーブルを作成して」→ Bitable自動作成
+• 「プロジェクト管理用のベースを作って」→ テンプレートから作成
+• 「Wikiスペースを作成」→ ナレッジベース作成
+• 「ヘルプ」→ 詳しい使い方
+
+何かお手伝いできることはありますか？"""
+
+# ヘルプ本文は呼び出しごとに組み立てる必要がないので定数化
+_HELP_TEXT = """
+🤖 **Lark Master MCP Bot** へようこそ！
+
+以下のことができます：
+
+📊 **Bitable (多次元テーブル)**
+• 「顧客管理テーブルを作成して」
+• 「プロジェクト管理用のベースを作って」
+• 「在庫管理システムを構築」
+
+📚 **Wiki / ドキュメント**
+• 「ナレッジベースを作成」
+• 「プロジェクトWikiを作って」
+• 「マニュアルを作成」
+
+✅ **タスク**
+• 「タスクを追加: レビュー依頼」
+• 「TODO: 資料作成」
+
+🔍 **検索**
+• 「〇〇を検索」
+• 「△△のドキュメントを探して」
+
+💡 **テンプレート**
+利用可能なテンプレート:
+• 顧客管理
+• プロジェクト管理
+• 在庫管理
+• 売上管理
+• イベント管理
+• 採用管理
+• 問い合わせ管理
+• 会議メモ
+"""
+
 
 class CommandType(Enum):
     """コマンドタイプ"""
@@ -25,7 +100,9 @@ class CommandType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# どちらもメッセージごとに生成されるのでfrozen+slotsで軽量化
+# （変更はreplace()で行う）
+@dataclass(frozen=True, slots=True)
 class ParsedCommand:
     """解析されたコマンド"""
     command_type: CommandType
@@ -34,7 +111,7 @@ class ParsedCommand:
     confidence: float  # 0.0 - 1.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CommandResult:
     """コマンド実行結果"""
     success: bool
@@ -92,12 +169,16 @@ class MessageParser:
         ],
     }
 
-    # パラメータ抽出パターン
+    # パラメータ抽出パターン。nameは境界が明確なので_compile_patternsで
+    # 1本の選択肢正規表現に統合するが、fields/descriptionの(.+)は行末まで
+    # 貪欲なため統合できない（finditerは重複しない一致しか返さず、先に
+    # 一致したキーが残りを飲み込んで後続キーが取れなくなる）。こちらは
+    # 従来どおりキーごとに独立して検索する。
     PARAM_PATTERNS = {
         "name": [
-            r"名前[はを:：]?\s*[「『]?([^」』\s]+)[」』]?",
+            r"名前[はを:：]?\s*[「『]?(?P<name_0_v>[^」』\s]+)[」』]?",
             r"(?:という|って)名前",
-            r"[「『]([^」』]+)[」』]",
+            r"[「『](?P<name_2_v>[^」』]+)[」』]",
         ],
         "fields": [
             r"フィールド[はを:：]?\s*(.+)",
@@ -112,14 +193,55 @@ class MessageParser:
 
     def __init__(self):
         self._compile_patterns()
+        # コマンド検出は入力文字列の純関数なのでLRUキャッシュで再利用。
+        # クラスのメソッドに直接@lru_cacheを付けるとキャッシュがselfを
+        # キーに全インスタンスを生かし続けるため（bugbear B019）、
+        # インスタンスごとのラッパーとしてここで被せる
+        self._detect = lru_cache(maxsize=1024)(self._detect)
 
     def _compile_patterns(self):
-        """正規表現パターンをコンパイル"""
-        self.compiled_patterns = {}
+        """正規表現パターンをコンパイル
+
+        コマンド検出はタイプごとのパターンリストをsearchで評価する。
+        1本の選択肢正規表現に統合すると重複しない一致しか得られず、
+        一致パターン数（信頼度）と同点時のタイプ優先順位が変わって
+        しまうため、統合するのはクイックフィルタ用のリテラル抽出のみ。
+        """
+        self.compiled_patterns: Dict[CommandType, List] = {}
+        literals = set()
         for cmd_type, patterns in self.COMMAND_PATTERNS.items():
             self.compiled_patterns[cmd_type] = [
                 re.compile(p, re.IGNORECASE) for p in patterns
             ]
+            for pattern in patterns:
+                # パターン中のリテラル語を抽出してクイックフィルタに使う
+                # （全分岐はリテラルの選択肢なので、正規表現が一致する
+                # メッセージは必ずいずれかのリテラルを含む）
+                for token in re.split(r"[\^$()|?:.*+\[\]\\]+", pattern):
+                    if len(token) >= 2:
+                        literals.add(token.lower())
+        self._trigger_keywords = tuple(literals)
+
+        # nameのパターンだけ1本の選択肢正規表現に統合する。キー内の
+        # 優先順位はパターン番号で保持する。
+        self._param_groups: Dict[str, Tuple[int, Optional[str]]] = {}
+        param_parts = []
+        for i, pattern in enumerate(self.PARAM_PATTERNS["name"]):
+            group = f"name_{i}"
+            vgroup = f"name_{i}_v"
+            if f"(?P<{vgroup}>" not in pattern:
+                vgroup = None
+            self._param_groups[group] = (i, vgroup)
+            param_parts.append(f"(?P<{group}>{pattern})")
+        self.param_pattern = re.compile("|".join(param_parts))
+
+        # fields/descriptionは独立検索用に個別コンパイル
+        self._field_patterns = tuple(
+            re.compile(p) for p in self.PARAM_PATTERNS["fields"]
+        )
+        self._desc_patterns = tuple(
+            re.compile(p) for p in self.PARAM_PATTERNS["description"]
+        )
 
     def parse(self, message: str) -> ParsedCommand:
         """
@@ -133,22 +255,11 @@ class MessageParser:
         """
         message = message.strip()
 
-        # コマンドタイプの検出
-        detected_type = CommandType.UNKNOWN
-        max_confidence = 0.0
-
-        for cmd_type, patterns in self.compiled_patterns.items():
-            for pattern in patterns:
-                if pattern.search(message):
-                    # パターン一致数で信頼度計算
-                    match_count = sum(1 for p in patterns if p.search(message))
-                    confidence = min(0.5 + (match_count * 0.2), 1.0)
-
-                    if confidence > max_confidence:
-                        max_confidence = confidence
-                        detected_type = cmd_type
+        # _detectは__init__でLRUキャッシュを被せてある
+        # （「ヘルプ」「テスト」のような定型メッセージの再解析を省く）
+        detected_type, max_confidence = self._detect(message)
 
-        # パラメータ抽出
+        # パラメータ抽出（dictを返すためキャッシュ対象にはしない）
         params = self._extract_parameters(message, detected_type)
 
         return ParsedCommand(
@@ -158,6 +269,26 @@ class MessageParser:
             confidence=max_confidence
         )
 
+    def _detect(self, message: str) -> Tuple[CommandType, float]:
+        """コマンドタイプと信頼度を判定（メッセージの純関数）"""
+        detected_type = CommandType.UNKNOWN
+        max_confidence = 0.0
+
+        # トリガー語のクイックフィルタ：1つも含まなければ正規表現を
+        # 走らせるまでもなくUNKNOWN（雑談メッセージの共通パスを短絡）
+        lowered = message.lower()
+        if any(kw in lowered for kw in self._trigger_keywords):
+            for cmd_type, patterns in self.compiled_patterns.items():
+                # 一致した「パターン数」で信頼度計算（出現回数ではない）。
+                # 同点時はCOMMAND_PATTERNSの定義順が優先
+                count = sum(1 for p in patterns if p.search(message))
+                if count:
+                    confidence = min(0.5 + (count * 0.2), 1.0)
+                    if confidence > max_confidence:
+                        max_confidence = confidence
+                        detected_type = cmd_type
+        return detected_type, max_confidence
+
     def _extract_parameters(
         self,
         message: str,
@@ -175,27 +306,36 @@ class MessageParser:
         """
         params = {}
 
-        # 名前の抽出
-        for pattern in self.PARAM_PATTERNS["name"]:
-            match = re.search(pattern, message)
-            if match:
-                params["name"] = match.group(1)
-                break
-
-        # フィールドの抽出（Bitable作成時）
+        # 名前の抽出：統合した選択肢正規表現を1周し、値をキャプチャした
+        # 一致のうちパターン番号が最も小さいものを採用。値グループの
+        # ない分岐（存在検出のみ）は候補に入れない——優先度だけ高くて
+        # 値を持たないため、下位パターンの有効なキャプチャを潰してしまう
+        best: Optional[Tuple[int, str]] = None
+        for m in self.param_pattern.finditer(message):
+            for group, (index, vgroup) in self._param_groups.items():
+                if vgroup is None or m.group(group) is None:
+                    continue
+                if best is None or index < best[0]:
+                    value = m.group(vgroup)
+                    if value is not None:
+                        best = (index, value)
+        if best:
+            params["name"] = best[1]
+
+        # フィールドの抽出（Bitable作成時）。descriptionとは独立に
+        # 検索するので、同じメッセージに両方あってもそれぞれ取れる
         if cmd_type == CommandType.CREATE_BITABLE:
-            for pattern in self.PARAM_PATTERNS["fields"]:
-                match = re.search(pattern, message)
+            for pattern in self._field_patterns:
+                match = pattern.search(message)
                 if match:
-                    fields_text = match.group(1)
                     # カンマや読点で分割
-                    fields = re.split(r'[,、，]', fields_text)
-                    params["fields"] = [f.strip() for f in fields if f.strip()]
+                    parts = _FIELD_SPLIT_RE.split(match.group(1))
+                    params["fields"] = [f.strip() for f in parts if f.strip()]
                     break
 
         # 説明の抽出
-        for pattern in self.PARAM_PATTERNS["description"]:
-            match = re.search(pattern, message)
+        for pattern in self._desc_patterns:
+            match = pattern.search(message)
             if match:
                 params["description"] = match.group(1)
                 break
@@ -227,7 +367,8 @@ class MessageHandler:
             from .smart_builder import SmartBitableBuilder
             self.smart_builder = SmartBitableBuilder(lark_client)
 
-        # コマンドハンドラの登録
+        # コマンドハンドラの登録。全メンバーを明示的に対応付け、
+        # CommandTypeへの追加漏れは直後の網羅性チェックで即検出する
         self.handlers: Dict[CommandType, Callable] = {
             CommandType.CREATE_BITABLE: self._handle_create_bitable,
             CommandType.CREATE_TABLE: self._handle_create_table,
@@ -239,7 +380,11 @@ class MessageHandler:
             CommandType.HELP: self._handle_help,
             CommandType.GREETING: self._handle_greeting,
             CommandType.CONVERSATION: self._handle_conversation,
+            CommandType.UNKNOWN: self._handle_unknown,
         }
+        for member in CommandType:
+            if member not in self.handlers:
+                raise KeyError(f"No handler registered for {member!r}")
 
     async def handle_message(self, message: str) -> CommandResult:
         """
@@ -256,25 +401,23 @@ class MessageHandler:
         logger.info(f"Parsed command: {parsed.command_type.value} (confidence: {parsed.confidence})")
 
         # 信頼度が低い場合は会話モードで応答
+        # （解析結果は共有される可能性があるため書き換えずに複製する）
         if parsed.confidence < 0.3:
-            parsed.command_type = CommandType.CONVERSATION
+            parsed = replace(parsed, command_type=CommandType.CONVERSATION)
             return await self._handle_conversation(parsed)
 
-        # ハンドラ実行
-        handler = self.handlers.get(parsed.command_type)
-        if handler:
-            try:
-                return await handler(parsed)
-            except Exception as e:
-                logger.error(f"Handler error: {e}")
-                return CommandResult(
-                    success=False,
-                    data={"error": str(e)},
-                    message=f"エラーが発生しました: {str(e)}",
-                    command_type=parsed.command_type
-                )
-        else:
-            return await self._handle_unknown(parsed)
+        # ハンドラ実行（網羅性は__init__で保証済み）
+        handler = self.handlers[parsed.command_type]
+        try:
+            return await handler(parsed)
+        except Exception as e:
+            logger.error(f"Handler error: {e}")
+            return CommandResult(
+                success=False,
+                data={"error": str(e)},
+                message=f"エラーが発生しました: {str(e)}",
+                command_type=parsed.command_type
+            )
 
     async def _handle_create_bitable(self, parsed: ParsedCommand) -> CommandResult:
         """Bitable作成処理"""
@@ -294,18 +437,26 @@ class MessageHandler:
             design = result.get("design", {})
             tables_info = design.get("tables", [])
 
-            response_msg = f"✅ Bitableを作成しました！\n\n"
-            response_msg += f"**Base名:** {design.get('name', 'N/A')}\n"
+            # 文字列の+=連結はテーブル/フィールド数に対して二次コストに
+            # なるため、リストに溜めて最後に一度だけjoinする
+            parts = [
+                "✅ Bitableを作成しました！\n\n",
+                f"**Base名:** {design.get('name', 'N/A')}\n",
+            ]
 
             if app_url:
-                response_msg += f"**URL:** {app_url}\n\n"
+                parts.append(f"**URL:** {app_url}\n\n")
 
             if tables_info:
-                response_msg += "**テーブル構成:**\n"
+                parts.append("**テーブル構成:**\n")
                 for table in tables_info:
-                    response_msg += f"\n📋 {table.get('name', 'テーブル')}\n"
+                    parts.append(f"\n📋 {table.get('name', 'テーブル')}\n")
                     for field in table.get('fields', []):
-                        response_msg += f"  • {field.get('name')} ({field.get('type')})\n"
+                        parts.append(
+                            f"  • {field.get('name')} ({field.get('type')})\n"
+                        )
+
+            response_msg = "".join(parts)
 
             return CommandResult(
                 success=True,
@@ -464,76 +615,21 @@ class MessageHandler:
 
     async def _handle_help(self, parsed: ParsedCommand) -> CommandResult:
         """ヘルプ表示"""
-        help_text = """
-🤖 **Lark Master MCP Bot** へようこそ！
-
-以下のことができます：
-
-📊 **Bitable (多次元テーブル)**
-• 「顧客管理テーブルを作成して」
-• 「プロジェクト管理用のベースを作って」
-• 「在庫管理システムを構築」
-
-📚 **Wiki / ドキュメント**
-• 「ナレッジベースを作成」
-• 「プロジェクトWikiを作って」
-• 「マニュアルを作成」
-
-✅ **タスク**
-• 「タスクを追加: レビュー依頼」
-• 「TODO: 資料作成」
-
-🔍 **検索**
-• 「〇〇を検索」
-• 「△△のドキュメントを探して」
-
-💡 **テンプレート**
-利用可能なテンプレート:
-• 顧客管理
-• プロジェクト管理
-• 在庫管理
-• 売上管理
-• イベント管理
-• 採用管理
-• 問い合わせ管理
-• 会議メモ
-"""
         return CommandResult(
             success=True,
-            data={"templates": [
-                "顧客管理", "プロジェクト管理", "在庫管理", "売上管理",
-                "イベント管理", "採用管理", "問い合わせ管理", "会議メモ"
-            ]},
-            message=help_text,
+            data={"templates": list(_HELP_TEMPLATES)},
+            message=_HELP_TEXT,
             command_type=CommandType.HELP
         )
 
     async def _handle_greeting(self, parsed: ParsedCommand) -> CommandResult:
         """挨拶・テスト応答"""
-        message = parsed.original_message.lower()
-
-        # テスト系のメッセージ
-        if any(kw in message for kw in ['テスト', 'test', '聞こえ', '返事', '応答']):
-            response = """📡 はい、聞こえています！
-
-LarkMasterMCP Bot が正常に動作しています。
-
-私にできることの例：
-• 「顧客管理テーブルを作成して」→ Bitable自動作成
-• 「プロジェクト管理用のベースを作って」→ テンプレートから作成
-• 「Wikiスペースを作成」→ ナレッジベース作成
-• 「ヘルプ」→ 詳しい使い方
-
-何かお手伝いできることはありますか？"""
+        # テスト系のメッセージ（5キーワードの逐次走査より1回の正規表現検索が速い）
+        if _TEST_RE.search(parsed.original_message):
+            response = _TEST_RESPONSE
         else:
             # 通常の挨拶
-            import random
-            greetings = [
-                "こんにちは！LarkMasterMCP Botです。何かお手伝いできることはありますか？",
-                "はい！何でもお聞きください。Bitableの作成やドキュメント管理などお手伝いします。",
-                "お呼びですか？「ヘルプ」で私にできることを確認できます！",
-            ]
-            response = random.choice(greetings)
+            response = _RNG.choice(_GREETINGS)
 
         return CommandResult(
             success=True,
@@ -619,13 +715,14 @@ class BotEventHandler:
         # メッセージ内容を取得
         content = message.get("content", "{}")
         try:
-            content_json = json.loads(content)
+            # orjson.JSONDecodeError / json.JSONDecodeErrorはどちらもValueError
+            content_json = _loads(content)
             text = content_json.get("text", "")
-        except json.JSONDecodeError:
+        except ValueError:
             text = content
 
         # @メンションを除去
-        text = re.sub(r'@\w+', '', text).strip()
+        text = _MENTION_RE.sub('', text).strip()
 
         if not text:
             return {"status": "empty_message"}
@@ -0,0 +1,143 @@
+"""Tests for LarkClient runtime behavior and webhook deduplication."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from lark_master_mcp.lark_client import LarkAPIError, LarkClient, _dumps_raw
+
+
+def _ok(data):
+    """Build a successful Lark API response body."""
+    return httpx.Response(200, content=_dumps_raw({"code": 0, "data": data}))
+
+
+def _auth():
+    """Build a tenant access token response."""
+    return httpx.Response(200, content=_dumps_raw(
+        {"code": 0, "tenant_access_token": "test_token", "expire": 7200}
+    ))
+
+
+def _client_with(handler):
+    """Create a LarkClient backed by a MockTransport."""
+    transport = httpx.MockTransport(handler)
+    return LarkClient(
+        "test_app_id",
+        "test_app_secret",
+        client=httpx.AsyncClient(transport=transport),
+    )
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    """Keep retry backoff out of test runtime."""
+    monkeypatch.setattr(LarkClient, "RETRY_BASE_DELAY", 0.0)
+
+
+class TestRetryBehavior:
+    """Test cases for the retry loop in _make_request."""
+
+    @pytest.mark.asyncio
+    async def test_retries_on_429_then_succeeds(self):
+        """A 429 is retried with backoff until the request succeeds."""
+        calls = {"n": 0}
+
+        def handler(request):
+            if "tenant_access_token" in str(request.url):
+                return _auth()
+            calls["n"] += 1
+            if calls["n"] < 3:
+                return httpx.Response(429)
+            return _ok({"items": []})
+
+        client = _client_with(handler)
+        result = await client._make_request("GET", "/im/v1/chats")
+        assert result == {"items": []}
+        assert calls["n"] == 3
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_post_protocol_error_is_not_retried(self):
+        """A truncated response on a POST must not be re-sent."""
+        calls = {"n": 0}
+
+        def handler(request):
+            if "tenant_access_token" in str(request.url):
+                return _auth()
+            calls["n"] += 1
+            raise httpx.RemoteProtocolError("truncated")
+
+        client = _client_with(handler)
+        with pytest.raises(LarkAPIError):
+            await client._make_request("POST", "/im/v1/messages", data={})
+        assert calls["n"] == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_protocol_error_is_retried(self):
+        """The same error on an idempotent GET is retried."""
+        calls = {"n": 0}
+
+        def handler(request):
+            if "tenant_access_token" in str(request.url):
+                return _auth()
+            calls["n"] += 1
+            raise httpx.RemoteProtocolError("truncated")
+
+        client = _client_with(handler)
+        with pytest.raises(LarkAPIError):
+            await client._make_request("GET", "/im/v1/chats")
+        assert calls["n"] == LarkClient.MAX_RETRIES + 1
+        await client.close()
+
+
+class TestReadCache:
+    """Test cases for the short-TTL GET cache and write invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_then_invalidation_after_write(self):
+        """Repeated reads are served from cache until a write drops it."""
+        gets = {"n": 0}
+
+        def handler(request):
+            if "tenant_access_token" in str(request.url):
+                return _auth()
+            if request.method == "GET":
+                gets["n"] += 1
+                return _ok({"items": [{"member_id": f"user_{gets['n']}"}]})
+            return _ok({})
+
+        client = _client_with(handler)
+        first = await client.get_file_permissions("tok")
+        second = await client.get_file_permissions("tok")
+        assert first == second
+        assert gets["n"] == 1
+
+        await client.share_file("tok", ["user_2"])
+        third = await client.get_file_permissions("tok")
+        assert gets["n"] == 2
+        assert third != first
+        await client.close()
+
+
+class TestMessageDeduplication:
+    """Test cases for the processed-message LRU in the bot server."""
+
+    def test_duplicate_message_is_suppressed(self):
+        from lark_master_mcp.bot_server import LarkBotServer
+
+        server = LarkBotServer("test_app_id", "test_app_secret")
+        assert server._is_duplicate_local("msg_1") is False
+        assert server._is_duplicate_local("msg_1") is True
+        assert server._is_duplicate_local("msg_2") is False
+
+    def test_dedup_lru_is_bounded(self):
+        from lark_master_mcp.bot_server import LarkBotServer
+
+        server = LarkBotServer("test_app_id", "test_app_secret")
+        server._max_processed = 10
+        for i in range(25):
+            server._is_duplicate_local(f"msg_{i}")
+        assert len(server.processed_messages) <= 10
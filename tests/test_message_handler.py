@@ -0,0 +1,55 @@
+"""Tests for the message parser."""
+
+from lark_master_mcp.message_handler import CommandType, MessageParser
+
+
+class TestMessageParser:
+    """Test cases for MessageParser."""
+
+    def test_confidence_counts_distinct_patterns_not_occurrences(self):
+        """Repeated hits on one pattern must not inflate confidence."""
+        parser = MessageParser()
+        parsed = parser.parse("テスト です、返事ください")
+
+        assert parsed.command_type == CommandType.GREETING
+        assert parsed.confidence == 0.7
+
+    def test_higher_pattern_count_beats_earlier_type(self):
+        """A type matching more patterns wins over an earlier weaker one."""
+        parser = MessageParser()
+        parsed = parser.parse("ベース作成とタスク追加")
+
+        assert parsed.command_type == CommandType.CREATE_TASK
+
+    def test_tie_resolved_in_definition_order(self):
+        """Equal-confidence types resolve in COMMAND_PATTERNS order."""
+        parser = MessageParser()
+        parsed = parser.parse("ナレッジベースを作成")
+
+        assert parsed.command_type == CommandType.CREATE_BITABLE
+
+    def test_extracts_fields_and_description_from_one_message(self):
+        """Both keys must be extracted when they appear in one message."""
+        parser = MessageParser()
+        parsed = parser.parse(
+            "顧客管理テーブルを作成して 説明: 顧客データベース フィールド: 名前, 電話"
+        )
+
+        assert parsed.command_type == CommandType.CREATE_BITABLE
+        assert parsed.parameters["fields"] == ["名前", "電話"]
+        assert parsed.parameters["description"].startswith("顧客データベース")
+
+    def test_detection_only_name_pattern_does_not_mask_capture(self):
+        """A value-less name branch must not suppress a bracket capture."""
+        parser = MessageParser()
+        parsed = parser.parse("「営業リスト」という名前のベースを作成")
+
+        assert parsed.parameters["name"] == "営業リスト"
+
+    def test_extracts_fields_without_description(self):
+        """Field extraction works on its own for Bitable commands."""
+        parser = MessageParser()
+        parsed = parser.parse("顧客管理テーブルを作成して フィールド: 名前, 電話")
+
+        assert parsed.command_type == CommandType.CREATE_BITABLE
+        assert parsed.parameters["fields"] == ["名前", "電話"]